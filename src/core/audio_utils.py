@@ -12,7 +12,13 @@ from utils.error_handler import AudioValidationError, logger
 
 
 class AudioPlayer:
-    """Audio playback manager with state control."""
+    """Audio playback manager with state control.
+    
+    Playback writes blocks to a blocking sounddevice OutputStream from a worker
+    thread, so no Python code runs on the PortAudio callback thread.
+    """
+    
+    WRITE_FRAMES = 4096  # Frames handed to the stream per write() call
     
     # Class-level registry using weak references so GC'd players are auto-removed
     _all_players: list = []
@@ -25,6 +31,7 @@ class AudioPlayer:
         self.current_sr = None
         self.stop_event = threading.Event()
         self.playback_thread = None
+        self._stream: Optional[sd.OutputStream] = None
         
         # Register this instance via weak reference
         with AudioPlayer._registry_lock:
@@ -67,25 +74,51 @@ class AudioPlayer:
         self.current_audio = audio
         self.current_sr = sample_rate
         self.is_playing_flag = True
-        self.stop_event.clear()
+        # Each playback gets its own event so a late-finishing previous
+        # thread cannot observe (or clear) the new playback's state
+        stop_event = threading.Event()
+        self.stop_event = stop_event
         
         def _play_thread():
+            stream = None
             try:
                 logger.debug("Playing audio through sounddevice...")
-                if self.stop_event.is_set():
+                if stop_event.is_set():
                     return
-                sd.play(audio, sample_rate)
-                sd.wait()
                 
-                if not self.stop_event.is_set():
+                # OutputStream.write expects (frames, channels)
+                data = np.asarray(audio, dtype=np.float32)
+                if data.ndim == 1:
+                    data = data.reshape(-1, 1)
+                
+                with sd.OutputStream(
+                    samplerate=sample_rate,
+                    channels=data.shape[1],
+                    dtype="float32",
+                    blocksize=2048,
+                    latency="high"
+                ) as stream:
+                    self._stream = stream
+                    for start in range(0, len(data), self.WRITE_FRAMES):
+                        if stop_event.is_set():
+                            break
+                        stream.write(data[start:start + self.WRITE_FRAMES])
+                # Leaving the block stops the stream, which waits for queued audio to finish
+                
+                if not stop_event.is_set():
                     logger.info("Audio playback completed")
                     if callback:
                         logger.debug("Calling playback completion callback")
                         callback()
             except Exception as e:
-                logger.error(f"Error during audio playback: {e}")
+                # stop() aborts the stream, which can interrupt a pending write()
+                if not stop_event.is_set():
+                    logger.error(f"Error during audio playback: {e}")
             finally:
-                self.is_playing_flag = False
+                if self._stream is stream:
+                    self._stream = None
+                if self.stop_event is stop_event:
+                    self.is_playing_flag = False
                 logger.debug("Playback thread finished")
         
         self.playback_thread = threading.Thread(target=_play_thread, daemon=True)
@@ -96,7 +129,13 @@ class AudioPlayer:
         if self.is_playing_flag:
             logger.debug("Stopping audio playback")
             self.stop_event.set()
-            sd.stop()
+            stream = self._stream
+            if stream is not None:
+                # Unblocks a write() in progress and discards buffered audio
+                try:
+                    stream.abort()
+                except Exception as e:
+                    logger.debug(f"Error aborting audio stream: {e}")
             self.is_playing_flag = False
             logger.info("Audio playback stopped")
     
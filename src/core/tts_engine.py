@@ -69,6 +69,10 @@ class TTSEngine:
         self.use_flash_attention = use_flash_attention
         self.workspace_dir = workspace_dir
         
+        # Settings as requested, before device/FlashAttention fallbacks are applied
+        self.requested_device = device
+        self.requested_flash_attention = use_flash_attention
+        
         # Note: Models are cached in default HuggingFace cache location (~/.cache/huggingface)
         # Only output files (voices, narrations, etc.) use workspace_dir
         
@@ -76,6 +80,7 @@ class TTSEngine:
         self.custom_voice_model = None
         self.voice_design_model = None
         self.base_model = None
+        self.custom_voice_model_size: Optional[str] = None
         
         # Check device availability
         self._validate_device()
@@ -95,6 +100,40 @@ class TTSEngine:
                     logger.warning(f"CUDA device {device_id} not found. Using cuda:0")
                     self.device = "cuda:0"
     
+    def apply_settings(self, device: str, use_flash_attention: bool) -> None:
+        """Change device and attention settings for subsequently loaded models.
+        
+        Models that are already loaded are not moved; unload them first.
+        
+        Args:
+            device: Compute device ('cuda:0', 'cpu', etc.)
+            use_flash_attention: Whether to use FlashAttention 2
+        """
+        self.requested_device = device
+        self.requested_flash_attention = use_flash_attention
+        self.device = device
+        self.use_flash_attention = use_flash_attention
+        self._validate_device()
+        logger.info(f"TTSEngine settings updated: device={self.device}, flash_attn={use_flash_attention}")
+    
+    def settings_match(self, device: str, use_flash_attention: bool, model_size: Optional[str]) -> bool:
+        """Check whether the loaded CustomVoice model already reflects the given settings.
+        
+        Args:
+            device: Requested compute device
+            use_flash_attention: Requested FlashAttention setting
+            model_size: Requested CustomVoice model size
+            
+        Returns:
+            True if reloading with these settings would change nothing
+        """
+        return (
+            self.custom_voice_model is not None
+            and self.custom_voice_model_size == model_size
+            and self.requested_device == device
+            and self.requested_flash_attention == use_flash_attention
+        )
+    
     @staticmethod
     def get_available_devices() -> List[dict]:
         """Get list of available compute devices.
@@ -237,23 +276,59 @@ class TTSEngine:
         logger.info(f"{model_label} model loaded successfully")
         return model
     
+    def _download_model(self, model_key: str, model_label: str, progress_callback: Optional[Callable] = None) -> None:
+        """Fetch model weights into the HuggingFace cache without instantiating the model.
+        
+        Args:
+            model_key: Key into self.MODELS (e.g. 'custom_voice_0.6B')
+            model_label: Human-readable label for log/progress messages
+            progress_callback: Optional callback for progress updates
+        """
+        from huggingface_hub import snapshot_download
+        
+        model_name = self.MODELS.get(model_key)
+        if not model_name:
+            raise ModelLoadError(f"Model not available for key: {model_key}")
+        
+        if progress_callback:
+            progress_callback(0, f"Downloading {model_label} model...")
+        
+        logger.info(f"Downloading model (no load): {model_name}")
+        snapshot_download(repo_id=model_name)
+        
+        if progress_callback:
+            progress_callback(100, f"{model_label} model downloaded")
+        
+        logger.info(f"{model_label} model downloaded")
+    
     def load_custom_voice_model(
         self,
         model_size: str = "1.7B",
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        download_only: bool = False
     ) -> None:
         """Load CustomVoice model for preset speakers.
         
         Args:
             model_size: Model size ('1.7B' or '0.6B')
             progress_callback: Optional callback for progress updates
+            download_only: Only fetch the weights into the cache; don't load the model
         """
         try:
+            if download_only:
+                self._download_model(
+                    model_key=f"custom_voice_{model_size}",
+                    model_label=f"CustomVoice {model_size}",
+                    progress_callback=progress_callback
+                )
+                return
+            
             self.custom_voice_model = self._load_model(
                 model_key=f"custom_voice_{model_size}",
                 model_label=f"CustomVoice {model_size}",
                 progress_callback=progress_callback
             )
+            self.custom_voice_model_size = model_size
         except ModelLoadError:
             raise
         except Exception as e:
@@ -601,6 +676,7 @@ class TTSEngine:
             if model_type == "custom_voice" and self.custom_voice_model is not None:
                 del self.custom_voice_model
                 self.custom_voice_model = None
+                self.custom_voice_model_size = None
                 logger.info("CustomVoice model unloaded")
             elif model_type == "voice_design" and self.voice_design_model is not None:
                 del self.voice_design_model
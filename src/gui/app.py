@@ -2,27 +2,44 @@
 
 import customtkinter as ctk
 from tkinter import messagebox
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
+import sys
+import threading
 import webbrowser
 from pathlib import Path
 from typing import Optional, Dict, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from utils.workspace_manager import WorkspaceManager
+    from core.tts_engine import TTSEngine
 
-from core.tts_engine import TTSEngine
 from core.voice_library import VoiceLibrary
 from core.audio_utils import AudioPlayer
 from utils.config import Config
 from utils.error_handler import logger
-from utils.threading_helpers import run_in_thread
-from utils.theme import get_theme_colors
+from utils.threading_helpers import run_in_thread, ProgressTracker
+from utils.theme import get_theme_colors, get_font
 
-from gui.tab_voice_creation import VoiceCreationTab
-from gui.tab_narration import NarrationTab
-from gui.tab_settings import SettingsTab
-from gui.tab_saved_voices import SavedVoicesTab
-from gui.components import LoadingOverlay
+from gui.components import LoadingOverlay, ToastOverlay
+
+
+def _spawn_folder_opener(path: Path) -> None:
+    """Open a folder with the desktop file manager on macOS/Linux.
+    
+    Uses posix_spawn rather than fork() since the process may hold torch/CUDA state.
+    
+    Args:
+        path: Folder to open
+    """
+    opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+    pid = os.posix_spawnp(opener, [opener, str(path)], os.environ)
+    # Reap the opener in the background so it doesn't linger as a zombie
+    threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+
+
+# Platform folder opener, resolved once at import
+_open_folder = os.startfile if os.name == 'nt' else _spawn_folder_opener
 
 
 class AboutDialog(ctk.CTkToplevel):
@@ -32,26 +49,38 @@ class AboutDialog(ctk.CTkToplevel):
         """Initialize About dialog.
         
         Args:
-            parent: Parent window
+            parent: Parent window (QwenTTSApp, provides cached screen_w/screen_h)
         """
         super().__init__(parent)
         
         self.title("About Qwen-semble")
-        self.geometry("600x650")
+        
+        # Size and center on screen in a single geometry call
+        x = (parent.screen_w // 2) - (600 // 2)
+        y = (parent.screen_h // 2) - (650 // 2)
+        self.geometry(f"600x650+{x}+{y}")
         self.resizable(False, False)
         
         # Center window on parent
         self.transient(parent)
         self.grab_set()
         
+        # Hide instead of destroying so the dialog can be reused
+        self.protocol("WM_DELETE_WINDOW", self.hide)
+        
         # Create UI
         self._create_ui()
-        
-        # Center on screen
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() // 2) - (600 // 2)
-        y = (self.winfo_screenheight() // 2) - (650 // 2)
-        self.geometry(f"600x650+{x}+{y}")
+    
+    def show(self) -> None:
+        """Show a previously hidden dialog again."""
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+    
+    def hide(self) -> None:
+        """Hide the dialog, keeping its widgets for the next open."""
+        self.grab_release()
+        self.withdraw()
     
     def _create_ui(self) -> None:
         """Create dialog UI."""
@@ -66,7 +95,7 @@ class AboutDialog(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             header_frame,
             text="Qwen-semble",
-            font=("Arial", 32, "bold")
+            font=get_font(32, "bold")
         )
         title_label.pack(pady=(15, 5))
         
@@ -74,7 +103,7 @@ class AboutDialog(ctk.CTkToplevel):
         subtitle_label = ctk.CTkLabel(
             header_frame,
             text="TTS Voice Studio",
-            font=("Arial", 16),
+            font=get_font(16),
             text_color=colors["text_secondary"]
         )
         subtitle_label.pack(pady=(0, 15))
@@ -83,7 +112,7 @@ class AboutDialog(ctk.CTkToplevel):
         version_label = ctk.CTkLabel(
             main_frame,
             text="Version 1.0.2",
-            font=("Arial", 12, "bold")
+            font=get_font(12, "bold")
         )
         version_label.pack(pady=(0, 10))
         
@@ -91,7 +120,7 @@ class AboutDialog(ctk.CTkToplevel):
         desc_label = ctk.CTkLabel(
             main_frame,
             text="A powerful voice cloning and narration application\\npowered by Qwen3-TTS models.",
-            font=("Arial", 11),
+            font=get_font(11),
             justify="center"
         )
         desc_label.pack(pady=(0, 20))
@@ -103,7 +132,7 @@ class AboutDialog(ctk.CTkToplevel):
         features_title = ctk.CTkLabel(
             features_frame,
             text="Features",
-            font=("Arial", 14, "bold")
+            font=get_font(14, "bold")
         )
         features_title.pack(pady=(10, 8))
         
@@ -120,7 +149,7 @@ class AboutDialog(ctk.CTkToplevel):
         features_label = ctk.CTkLabel(
             features_frame,
             text=features_text,
-            font=("Arial", 11),
+            font=get_font(11),
             justify="left"
         )
         features_label.pack(pady=(0, 10), padx=20)
@@ -132,7 +161,7 @@ class AboutDialog(ctk.CTkToplevel):
         github_label = ctk.CTkLabel(
             github_frame,
             text="GitHub Repository",
-            font=("Arial", 12, "bold")
+            font=get_font(12, "bold")
         )
         github_label.pack(pady=(10, 5))
         
@@ -140,7 +169,7 @@ class AboutDialog(ctk.CTkToplevel):
         github_link = ctk.CTkButton(
             github_frame,
             text=github_url,
-            font=("Arial", 10),
+            font=get_font(10),
             fg_color="transparent",
             hover_color=("gray80", "gray25"),
             text_color=("blue", "lightblue"),
@@ -154,7 +183,7 @@ class AboutDialog(ctk.CTkToplevel):
         copyright_label = ctk.CTkLabel(
             main_frame,
             text="\u00a9 2026 - Licensed under MIT",
-            font=("Arial", 10),
+            font=get_font(10),
             text_color=colors["text_secondary"]
         )
         copyright_label.pack(pady=(5, 15))
@@ -163,7 +192,7 @@ class AboutDialog(ctk.CTkToplevel):
         close_btn = ctk.CTkButton(
             main_frame,
             text="Close",
-            command=self.destroy,
+            command=self.hide,
             width=120,
             height=32
         )
@@ -185,6 +214,10 @@ class QwenTTSApp(ctk.CTk):
         self.workspace_mgr = workspace_mgr
         self.model_selection = model_selection  # Store for model loading
         
+        # Working directory is fixed for the lifetime of the process
+        self._workspace_dir = workspace_mgr.get_working_directory()
+        self._workspace_dir_abs = self._workspace_dir.absolute()
+        
         # Configure window
         self.title("Qwen-semble - TTS Voice Studio")
         
@@ -194,6 +227,10 @@ class QwenTTSApp(ctk.CTk):
         window_height = self.config.get("window_height", 800)
         self.geometry(f"{window_width}x{window_height}")
         
+        # Screen size doesn't change while running; query the X server once
+        self.screen_w = self.winfo_screenwidth()
+        self.screen_h = self.winfo_screenheight()
+        
         # Set theme
         theme = self.config.get("theme", "dark")
         ctk.set_appearance_mode(theme)
@@ -202,11 +239,19 @@ class QwenTTSApp(ctk.CTk):
         
         # Initialize components
         logger.debug("Initializing application components...")
-        self.tts_engine = None
+        self.tts_engine: Optional['TTSEngine'] = None
         self.voice_library = VoiceLibrary(workspace_mgr=workspace_mgr)
         self.audio_player = AudioPlayer()
         logger.debug("Voice library and audio player initialized")
         
+        # Worker threads post model progress here; the Tk thread drains it
+        self._progress = ProgressTracker()
+        self._progress_dialog: Optional[LoadingOverlay] = None
+        self._progress_after_id: Optional[str] = None
+        
+        # About dialog is built on first open and reused afterwards
+        self._about_dialog: Optional[AboutDialog] = None
+        
         # Create UI
         logger.debug("Creating UI components...")
         self._create_menu()
@@ -229,7 +274,7 @@ class QwenTTSApp(ctk.CTk):
         menu_frame.pack(fill="x", padx=5, pady=5)
         
         # File menu buttons
-        file_label = ctk.CTkLabel(menu_frame, text="File:", font=("Arial", 12, "bold"))
+        file_label = ctk.CTkLabel(menu_frame, text="File:", font=get_font(12, "bold"))
         file_label.pack(side="left", padx=5)
         
         open_workspace_btn = ctk.CTkButton(
@@ -252,7 +297,7 @@ class QwenTTSApp(ctk.CTk):
     def _create_tabs(self) -> None:
         """Create tabbed interface."""
         # Create tab view
-        self.tabview = ctk.CTkTabview(self)
+        self.tabview = ctk.CTkTabview(self, command=self._on_tab_changed)
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Add tabs
@@ -266,54 +311,132 @@ class QwenTTSApp(ctk.CTk):
         self.narration_tab = None
         self.saved_voices_tab = None
         self.settings_tab = None
+        
+        # No-model warning banner, built the first time it is shown
+        self.warning_banner: Optional[ctk.CTkFrame] = None
+        
+        # Tab content builders, in background build order
+        self._tab_builders = {
+            "Voice Model Library": self._build_saved_voices_tab,
+            "Narration": self._build_narration_tab,
+            "Voice Creation": self._build_voice_creation_tab,
+            "Settings": self._build_settings_tab,
+        }
+        self._built_tabs: set = set()
+        self._tab_init_started = False
+        self._tabs_built = False  # True once every tab has been built successfully
     
     def _init_tabs(self) -> None:
-        """Initialize tab content after models are loaded."""
-        try:
-            # Voice Model Library tab (create first so we can refresh it)
-            self.saved_voices_tab = SavedVoicesTab(
-                self.tabview.tab("Voice Model Library"),
-                self.voice_library,
-                self.config,
-                workspace_mgr=self.workspace_mgr
-            )
-            
-            # Narration tab (create second to get refresh callback)
-            self.narration_tab = NarrationTab(
-                self.tabview.tab("Narration"),
-                self.tts_engine,
-                self.voice_library,
-                self.config,
-                workspace_mgr=self.workspace_mgr
-            )
-            
-            # Voice Creation tab (unified clone and design with refresh callbacks)
-            self.voice_creation_tab = VoiceCreationTab(
-                self.tabview.tab("Voice Creation"),
-                self.tts_engine,
-                self.voice_library,
-                self.config,
-                narration_refresh_callback=self.narration_tab.refresh_voice_list,
-                saved_voices_refresh_callback=self.saved_voices_tab.refresh,
-                workspace_mgr=self.workspace_mgr
-            )
-            
-            # Settings tab
-            self.settings_tab = SettingsTab(
-                self.tabview.tab("Settings"),
-                self.tts_engine,
-                self.config,
-                self._reload_models,
-                workspace_mgr=self.workspace_mgr,
-                download_callback=self._download_and_load_models
-            )
-            
+        """Initialize tab content after models are loaded.
+        
+        The visible tab is built immediately; the others are built one per
+        idle callback so the main loop can repaint in between. Selecting a
+        tab that has not been built yet builds it on the spot.
+        """
+        if self._tabs_built:
+            return
+        self._tab_init_started = True
+        
+        self._build_tab(self.tabview.get())
+        pending = [name for name in self._tab_builders if name not in self._built_tabs]
+        self.after_idle(self._build_next_tab, pending)
+    
+    def _build_next_tab(self, pending: List[str]) -> None:
+        """Build the next pending tab and schedule the rest.
+        
+        Args:
+            pending: Tab names still to be built, in build order
+        """
+        if pending:
+            self._build_tab(pending[0])
+            self.after_idle(self._build_next_tab, pending[1:])
+            return
+        
+        self._tabs_built = len(self._built_tabs) == len(self._tab_builders)
+        if self._tabs_built:
             logger.info("Tabs initialized")
-            
+    
+    def _build_tab(self, name: str) -> None:
+        """Build a single tab's content if it has not been built yet.
+        
+        Args:
+            name: Tab name as shown in the tab view
+        """
+        if name in self._built_tabs:
+            return
+        
+        try:
+            self._tab_builders[name]()
+            self._built_tabs.add(name)
         except Exception as e:
-            logger.error(f"Error initializing tabs: {e}")
+            logger.error(f"Error initializing {name} tab: {e}")
             messagebox.showerror("Error", f"Failed to initialize interface: {e}")
     
+    def _on_tab_changed(self) -> None:
+        """Build the selected tab on first visit."""
+        if self._tab_init_started:
+            self._build_tab(self.tabview.get())
+    
+    def _build_saved_voices_tab(self) -> None:
+        """Build the Voice Model Library tab."""
+        from gui.tab_saved_voices import SavedVoicesTab
+        
+        self.saved_voices_tab = SavedVoicesTab(
+            self.tabview.tab("Voice Model Library"),
+            self.voice_library,
+            self.config,
+            workspace_mgr=self.workspace_mgr
+        )
+    
+    def _build_narration_tab(self) -> None:
+        """Build the Narration tab."""
+        from gui.tab_narration import NarrationTab
+        
+        self.narration_tab = NarrationTab(
+            self.tabview.tab("Narration"),
+            self.tts_engine,
+            self.voice_library,
+            self.config,
+            workspace_mgr=self.workspace_mgr
+        )
+    
+    def _build_voice_creation_tab(self) -> None:
+        """Build the Voice Creation tab (unified clone and design)."""
+        from gui.tab_voice_creation import VoiceCreationTab
+        
+        self.voice_creation_tab = VoiceCreationTab(
+            self.tabview.tab("Voice Creation"),
+            self.tts_engine,
+            self.voice_library,
+            self.config,
+            narration_refresh_callback=self._refresh_narration_voices,
+            saved_voices_refresh_callback=self._refresh_saved_voices,
+            workspace_mgr=self.workspace_mgr
+        )
+    
+    def _build_settings_tab(self) -> None:
+        """Build the Settings tab."""
+        from gui.tab_settings import SettingsTab
+        
+        self.settings_tab = SettingsTab(
+            self.tabview.tab("Settings"),
+            self.tts_engine,
+            self.config,
+            self._reload_models,
+            workspace_mgr=self.workspace_mgr,
+            download_callback=self._download_and_load_models
+        )
+    
+    def _refresh_narration_voices(self) -> None:
+        """Refresh the narration voice list if that tab has been built."""
+        if self.narration_tab:
+            self.narration_tab.refresh_voice_list()
+    
+    def _refresh_saved_voices(self) -> None:
+        """Refresh the voice library tab if it has been built."""
+        if self.saved_voices_tab:
+            self.saved_voices_tab.refresh()
+    
     def _initialize_models(self) -> None:
         """Initialize models based on first launch or existing configuration."""
         # Check if this is first launch (model_selection provided)
@@ -337,8 +460,9 @@ class QwenTTSApp(ctk.CTk):
             # Not first launch - check config for downloaded models
             logger.info("Not first launch - checking config for models")
             
-            downloaded_models = self.config.get("downloaded_models", [])
-            active_model = self.config.get("active_model", None)
+            downloaded_models, active_model = self.config.get_many(
+                ("downloaded_models", "active_model")
+            )
             
             if not downloaded_models or active_model is None:
                 # No models downloaded
@@ -355,9 +479,9 @@ class QwenTTSApp(ctk.CTk):
         logger.info("Initializing application without models")
         
         # Create TTS engine instance without loading models
-        self.tts_engine = TTSEngine(
-            device=self.config.get("device", "cuda:0"),
-            workspace_dir=self.workspace_mgr.get_working_directory()
+        self._ensure_tts_engine(
+            self.config.get("device", "cuda:0"),
+            self.config.get("use_flash_attention", False)
         )
         
         # Initialize tabs
@@ -368,14 +492,23 @@ class QwenTTSApp(ctk.CTk):
     
     def _show_no_model_warning(self) -> None:
         """Show warning banner when no model is loaded."""
+        if self.warning_banner is None:
+            self.warning_banner = self._create_warning_banner()
+        self.warning_banner.pack(fill="x", padx=5, pady=(5, 0), before=self.tabview)
+    
+    def _create_warning_banner(self) -> ctk.CTkFrame:
+        """Build the (unpacked) no-model warning banner.
+        
+        Returns:
+            Banner frame, shown and hidden with pack/pack_forget
+        """
         warning_frame = ctk.CTkFrame(self, fg_color="orange", height=50)
-        warning_frame.pack(fill="x", padx=5, pady=(5, 0), before=self.tabview)
         warning_frame.pack_propagate(False)
         
         warning_label = ctk.CTkLabel(
             warning_frame,
             text="⚠️ No AI model loaded. TTS features are disabled.",
-            font=("Arial", 14, "bold"),
+            font=get_font(14, "bold"),
             text_color="white"
         )
         warning_label.pack(side="left", padx=20, pady=10)
@@ -386,17 +519,17 @@ class QwenTTSApp(ctk.CTk):
             command=self._show_model_download_dialog,
             fg_color="darkgreen",
             hover_color="green",
-            font=("Arial", 12, "bold")
+            font=get_font(12, "bold")
         )
         download_btn.pack(side="right", padx=20, pady=10)
         
-        self.warning_banner = warning_frame
+        return warning_frame
     
     def _show_model_download_dialog(self) -> None:
         """Show model selection dialog to download models."""
         from gui.model_selection_dialog import show_model_selection_dialog
         
-        model_selection = show_model_selection_dialog()
+        model_selection = show_model_selection_dialog(self)
         
         if model_selection and not model_selection["skip"]:
             models_to_download = model_selection["models"]
@@ -407,10 +540,9 @@ class QwenTTSApp(ctk.CTk):
             self.config.set("active_model", active_model, save=False)
             self.config.set("device", model_selection["device"], save=True)
             
-            # Remove warning banner
-            if hasattr(self, 'warning_banner'):
-                self.warning_banner.destroy()
-                delattr(self, 'warning_banner')
+            # Hide warning banner (kept for reuse if the download fails)
+            if self.warning_banner is not None:
+                self.warning_banner.pack_forget()
             
             # Download and load models
             self._download_and_load_models(models_to_download, active_model)
@@ -430,53 +562,49 @@ class QwenTTSApp(ctk.CTk):
             message="Preparing to download models..."
         )
         
+        # Read engine settings once on the main thread
+        device = self.config.get("device", "cuda:0")
+        use_flash_attention = self.config.get("use_flash_attention", False)
+        
         def download_task():
             """Background task to download and load models."""
             try:
                 # Initialize TTS engine
-                device = self.config.get("device", "cuda:0")
-                use_flash_attention = self.config.get("use_flash_attention", False)
-                
                 logger.info(f"Initializing TTS engine: device={device}")
+                self._ensure_tts_engine(device, use_flash_attention)
                 
-                self.tts_engine = TTSEngine(
-                    device=device,
-                    dtype="bfloat16",
-                    use_flash_attention=use_flash_attention,
-                    workspace_dir=self.workspace_mgr.get_working_directory()
-                )
-                
+                # Fetch all selected snapshots concurrently (network-bound, no shared files);
+                # a single model is left to the load step below
                 total_models = len(models_to_download)
-                
-                # Download each model
-                for idx, model_size in enumerate(models_to_download, 1):
-                    logger.info(f"Downloading model {idx}/{total_models}: {model_size}")
-                    loading_dialog.update_progress(
-                        0,
-                        f"Downloading model {idx}/{total_models}: Qwen3-TTS-{model_size}..."
-                    )
-                    
-                    # Load the model (will download if needed)
-                    self.tts_engine.load_custom_voice_model(
-                        model_size=model_size,
-                        progress_callback=lambda p, m: loading_dialog.update_progress(
-                            ((idx - 1) / total_models + p / total_models) * 100,
-                            f"Model {idx}/{total_models}: {m}"
-                        )
-                    )
+                if total_models > 1:
+                    self._progress.set_progress(0, f"Downloading {total_models} models...")
                     
-                    # Unload if not the active model (save memory)
-                    if model_size != active_model:
-                        logger.info(f"Unloading {model_size} (not active model)")
-                        self.tts_engine.unload_all_models()
+                    with ThreadPoolExecutor(max_workers=total_models) as executor:
+                        futures = {
+                            executor.submit(
+                                self.tts_engine.load_custom_voice_model,
+                                model_size=model_size,
+                                download_only=True
+                            ): model_size
+                            for model_size in models_to_download
+                        }
+                        for done, future in enumerate(as_completed(futures), 1):
+                            future.result()  # Re-raise download errors
+                            logger.info(f"Downloaded model {done}/{total_models}: {futures[future]}")
+                            self._progress.set_progress(
+                                done / total_models * 90,
+                                f"Downloaded Qwen3-TTS-{futures[future]} ({done}/{total_models})"
+                            )
                 
-                # Load active model if it's not the last one downloaded
-                if active_model != models_to_download[-1]:
-                    logger.info(f"Loading active model: {active_model}")
-                    loading_dialog.update_progress(95, f"Loading active model: {active_model}...")
-                    self.tts_engine.load_custom_voice_model(model_size=active_model)
+                # Load the active model exactly once (downloads it if needed)
+                logger.info(f"Loading active model: {active_model}")
+                self._progress.set_progress(90, f"Loading active model: Qwen3-TTS-{active_model}...")
+                self.tts_engine.load_custom_voice_model(
+                    model_size=active_model,
+                    progress_callback=lambda p, m: self._progress.set_progress(90 + p / 10, m)
+                )
                 
-                loading_dialog.update_progress(100, "Models ready!")
+                self._progress.set_progress(100, "Models ready!")
                 logger.info("All models downloaded successfully")
                 
                 return True
@@ -487,20 +615,21 @@ class QwenTTSApp(ctk.CTk):
         
         def on_complete(result):
             """Called when download completes."""
+            self._stop_progress_drain()
             loading_dialog.close()
             
             if isinstance(result, Exception):
                 logger.error(f"Model download failed: {result}")
-                messagebox.showerror(
-                    "Download Failed",
-                    f"Failed to download models:\n\n{str(result)}\n\n"
+                self._init_without_models()
+                ToastOverlay(
+                    self,
+                    f"Failed to download models: {result}\n"
                     "Check your internet connection and try again."
                 )
-                self._init_without_models()
             else:
                 logger.info("Models downloaded and loaded successfully")
                 # Initialize tabs if not already done
-                if not self.voice_creation_tab:
+                if not self._tabs_built:
                     self._init_tabs()
                 # Refresh settings tab UI if it exists
                 elif self.settings_tab and hasattr(self.settings_tab, '_refresh_model_selection_ui'):
@@ -508,11 +637,13 @@ class QwenTTSApp(ctk.CTk):
         
         def on_error(error):
             """Called if download fails."""
+            self._stop_progress_drain()
             loading_dialog.close()
-            messagebox.showerror("Error", f"Failed to download models: {error}")
             self._init_without_models()
+            ToastOverlay(self, f"Failed to download models: {error}")
         
         # Run in background thread
+        self._start_progress_drain(loading_dialog)
         run_in_thread(
             self,
             download_task,
@@ -532,31 +663,26 @@ class QwenTTSApp(ctk.CTk):
             message=f"Loading Qwen3-TTS-{model_size} model..."
         )
         
+        # Read engine settings once on the main thread
+        device = self.config.get("device", "cuda:0")
+        use_flash_attention = self.config.get("use_flash_attention", False)
+        
         def load_task():
             """Background task to load model."""
             try:
                 logger.info(f"Starting model loading: {model_size}")
                 
                 # Initialize TTS engine if not already done
-                if not self.tts_engine:
-                    device = self.config.get("device", "cuda:0")
-                    use_flash_attention = self.config.get("use_flash_attention", False)
-                    
-                    self.tts_engine = TTSEngine(
-                        device=device,
-                        dtype="bfloat16",
-                        use_flash_attention=use_flash_attention,
-                        workspace_dir=self.workspace_mgr.get_working_directory()
-                    )
+                self._ensure_tts_engine(device, use_flash_attention)
                 
                 # Load the model
                 self.tts_engine.load_custom_voice_model(
                     model_size=model_size,
-                    progress_callback=lambda p, m: loading_dialog.update_progress(p * 100, m)
+                    progress_callback=lambda p, m: self._progress.set_progress(p, m)
                 )
                 
                 logger.info(f"Model {model_size} loaded successfully")
-                loading_dialog.update_progress(100, "Model loaded!")
+                self._progress.set_progress(100, "Model loaded!")
                 
                 return True
                 
@@ -566,20 +692,21 @@ class QwenTTSApp(ctk.CTk):
         
         def on_complete(result):
             """Called when model loading completes."""
+            self._stop_progress_drain()
             loading_dialog.close()
             
             if isinstance(result, Exception):
                 logger.error(f"Model loading failed: {result}")
-                messagebox.showerror(
-                    "Loading Failed",
-                    f"Failed to load model:\n\n{str(result)}\n\n"
+                self._init_without_models()
+                ToastOverlay(
+                    self,
+                    f"Failed to load model: {result}\n"
                     "Continuing without models."
                 )
-                self._init_without_models()
             else:
                 logger.info("Model loaded successfully")
                 # Initialize tabs if not already done
-                if not self.voice_creation_tab:
+                if not self._tabs_built:
                     self._init_tabs()
                 # Refresh settings tab UI if it exists
                 elif self.settings_tab and hasattr(self.settings_tab, '_refresh_model_selection_ui'):
@@ -587,11 +714,13 @@ class QwenTTSApp(ctk.CTk):
         
         def on_error(error):
             """Called if loading fails."""
+            self._stop_progress_drain()
             loading_dialog.close()
-            messagebox.showerror("Error", f"Failed to load model: {error}")
             self._init_without_models()
+            ToastOverlay(self, f"Failed to load model: {error}")
         
         # Run in background thread
+        self._start_progress_drain(loading_dialog)
         run_in_thread(
             self,
             load_task,
@@ -599,9 +728,83 @@ class QwenTTSApp(ctk.CTk):
             on_error=on_error
         )
     
+    def _ensure_tts_engine(self, device: str, use_flash_attention: bool) -> 'TTSEngine':
+        """Return the shared TTS engine, creating it on first use.
+        
+        The tabs hold a reference to this engine, so it is reconfigured in
+        place rather than replaced when the settings change.
+        
+        Args:
+            device: Compute device ('cuda:0', 'cpu', etc.)
+            use_flash_attention: Whether to use FlashAttention 2
+            
+        Returns:
+            TTSEngine instance
+        """
+        if self.tts_engine is None:
+            from core.tts_engine import TTSEngine
+            
+            self.tts_engine = TTSEngine(
+                device=device,
+                dtype="bfloat16",
+                use_flash_attention=use_flash_attention,
+                workspace_dir=self._workspace_dir
+            )
+        elif (self.tts_engine.requested_device != device
+              or self.tts_engine.requested_flash_attention != use_flash_attention):
+            # Loaded models stay on their old device, so drop them first
+            self.tts_engine.unload_all_models()
+            self.tts_engine.apply_settings(device, use_flash_attention)
+        
+        return self.tts_engine
+    
+    def _start_progress_drain(self, dialog: LoadingOverlay) -> None:
+        """Start forwarding worker progress to a loading dialog.
+        
+        Args:
+            dialog: Dialog that receives the progress updates
+        """
+        self._stop_progress_drain()
+        self._progress_dialog = dialog
+        self._progress_after_id = self.after(50, self._drain_progress)
+    
+    def _stop_progress_drain(self) -> None:
+        """Stop forwarding worker progress and discard anything pending."""
+        if self._progress_after_id is not None:
+            self.after_cancel(self._progress_after_id)
+            self._progress_after_id = None
+        self._progress_dialog = None
+        while self._progress.get_update() is not None:
+            pass
+    
+    def _drain_progress(self) -> None:
+        """Apply the most recent queued progress update, then reschedule."""
+        self._progress_after_id = None
+        if self._progress_dialog is None:
+            return
+        
+        # Only the latest update matters; skip the intermediates
+        latest = None
+        update = self._progress.get_update()
+        while update is not None:
+            latest = update
+            update = self._progress.get_update()
+        
+        if latest is not None:
+            self._progress_dialog.update_progress(latest.percentage, latest.message)
+        self._progress_after_id = self.after(50, self._drain_progress)
+    
     def _reload_models(self) -> None:
         """Reload models with new settings."""
         active_model = self.config.get("active_model", "1.7B")
+        device = self.config.get("device", "cuda:0")
+        use_flash_attention = self.config.get("use_flash_attention", False)
+        
+        # Nothing model-affecting changed: skip the unload/load cycle
+        if self.tts_engine and self.tts_engine.settings_match(device, use_flash_attention, active_model):
+            logger.info("No model-affecting changes, skipping reload")
+            ToastOverlay(self, "The loaded model already matches the current settings.", style="info")
+            return
         
         message = (
             "This will unload current models and reload with new settings.\n"
@@ -615,9 +818,10 @@ class QwenTTSApp(ctk.CTk):
         )
         
         if response:
-            # Unload current models
+            # Unload current models and apply the new engine settings
             if self.tts_engine:
                 self.tts_engine.unload_all_models()
+                self._ensure_tts_engine(device, use_flash_attention)
             
             # Reload the active model
             if active_model:
@@ -628,25 +832,24 @@ class QwenTTSApp(ctk.CTk):
     
     def _open_workspace_folder(self) -> None:
         """Open working directory in file explorer."""
-        workspace_path = self.workspace_mgr.get_working_directory().absolute()
+        workspace_path = self._workspace_dir_abs
         
         try:
-            if os.name == 'nt':  # Windows
-                os.startfile(workspace_path)
-            elif os.name == 'posix':  # macOS and Linux
-                import subprocess
-                subprocess.Popen(['xdg-open', str(workspace_path)])
+            _open_folder(workspace_path)
         except Exception as e:
             logger.error(f"Failed to open working directory: {e}")
             messagebox.showerror("Error", f"Failed to open folder: {e}")
     
     def _show_about(self) -> None:
         """Show about dialog."""
-        AboutDialog(self)
+        if self._about_dialog is not None and self._about_dialog.winfo_exists():
+            self._about_dialog.show()
+            return
+        self._about_dialog = AboutDialog(self)
     
     def _on_closing(self) -> None:
         """Handle window close event."""
-        # Save window size
+        # Save window size (Config skips the write if the geometry is unchanged)
         self.config.set("window_width", self.winfo_width(), save=False)
         self.config.set("window_height", self.winfo_height(), save=False)
         self.config.save()
@@ -654,9 +857,10 @@ class QwenTTSApp(ctk.CTk):
         # Stop audio playback
         self.audio_player.stop()
         
-        # Unload models
+        # Unload models in the background so the window closes immediately;
+        # anything left over is released at interpreter shutdown
         if self.tts_engine:
-            self.tts_engine.unload_all_models()
+            threading.Thread(target=self.tts_engine.unload_all_models, daemon=True).start()
         
         logger.info("Application closing")
         self.destroy()
@@ -1,13 +1,42 @@
 """Reusable GUI components for the application."""
 
+import os.path
+import threading
+from itertools import cycle, islice, repeat
+import tkinter as tk
 import customtkinter as ctk
-from tkinter import filedialog
-from typing import Optional, Callable, List
-from pathlib import Path
+from typing import Optional, Callable, Dict, Iterator, List, Sequence, Tuple, TYPE_CHECKING
 
-from core.audio_utils import AudioPlayer
 from utils.error_handler import logger
-from utils.theme import get_theme_colors
+from utils.theme import get_theme_colors, get_font
+
+if TYPE_CHECKING:
+    from core.audio_utils import AudioPlayer
+
+# Shared file type filter for pickers created without one
+_DEFAULT_FILETYPES = (("All files", "*.*"),)
+
+
+def _noop(*_args) -> None:
+    """Stand-in for callbacks that were not provided."""
+
+
+def bind_destroy(widget: tk.Misc, callback: Callable[[], None]) -> None:
+    """Call a function when a widget itself is destroyed.
+    
+    CTkFrame.bind() attaches bindings to the frame's internal canvas, so a
+    <Destroy> bound that way reports the canvas as event.widget. Binding
+    through tk.Misc.bind targets the frame's own Tk window instead.
+    
+    Args:
+        widget: Widget to watch
+        callback: Function called once, when the widget (not a child) is destroyed
+    """
+    def _on_destroy(event) -> None:
+        if event.widget is widget:
+            callback()
+    
+    tk.Misc.bind(widget, "<Destroy>", _on_destroy, "+")
 
 
 class AudioPlayerWidget(ctk.CTkFrame):
@@ -22,9 +51,16 @@ class AudioPlayerWidget(ctk.CTkFrame):
         """
         super().__init__(parent, **kwargs)
         
-        self.audio_player = AudioPlayer()
+        # Imported here so loading this module doesn't pull in numpy/sounddevice
+        from core.audio_utils import AudioPlayer
+        
+        self.audio_player: 'AudioPlayer' = AudioPlayer()
         self.current_audio = None
         self.current_sr = None
+        self._ready_text: Optional[str] = None  # Status text shown while stopped, set by load_audio
+        self._complete_after_id = None
+        self._destroyed = False
+        self._showing_playback = False  # True while the widgets show the "playing" state
         
         # Create UI
         self.play_button = ctk.CTkButton(
@@ -33,14 +69,16 @@ class AudioPlayerWidget(ctk.CTkFrame):
             command=self._toggle_playback,
             width=100
         )
-        self.play_button.pack(side="left", padx=5)
+        self.play_button.grid(row=0, column=0, padx=5)
         
         self.status_label = ctk.CTkLabel(
             self,
             text="No audio loaded",
             width=200
         )
-        self.status_label.pack(side="left", padx=5)
+        self.status_label.grid(row=0, column=1, padx=5)
+        
+        bind_destroy(self, self._on_destroy)
         
         self._update_ui()
     
@@ -53,8 +91,8 @@ class AudioPlayerWidget(ctk.CTkFrame):
         """
         self.current_audio = audio
         self.current_sr = sample_rate
-        duration = len(audio) / sample_rate
-        self.status_label.configure(text=f"Ready ({duration:.1f}s)")
+        self._ready_text = f"Ready ({len(audio) / sample_rate:.1f}s)"
+        self.status_label.configure(text=self._ready_text)
         self.play_button.configure(state="normal")
     
     def _toggle_playback(self) -> None:
@@ -72,10 +110,11 @@ class AudioPlayerWidget(ctk.CTkFrame):
                     return
                 self.play_button.configure(text="⏸ Stop")
                 self.status_label.configure(text="Playing...")
+                self._showing_playback = True
                 self.audio_player.play(
                     self.current_audio,
                     self.current_sr,
-                    callback=self._on_playback_complete
+                    callback=self._schedule_complete
                 )
             except Exception as e:
                 # Widget might have been destroyed
@@ -90,20 +129,43 @@ class AudioPlayerWidget(ctk.CTkFrame):
             # Widget might have been destroyed
             logger.debug(f"Error stopping playback (widget may be destroyed): {e}")
     
-    def _on_playback_complete(self) -> None:
-        """Handle playback completion."""
-        # Check if widget still exists before updating (prevents crashes when widget destroyed during playback)
+    def _schedule_complete(self) -> None:
+        """Marshal playback completion from the audio thread onto the Tk thread."""
+        if self._destroyed:
+            return
         try:
-            if not self.winfo_exists():
-                return
-            self.play_button.configure(text="▶ Play")
-            if self.current_audio is not None and self.current_sr is not None:
-                duration = len(self.current_audio) / self.current_sr
-                self.status_label.configure(text=f"Ready ({duration:.1f}s)")
-        except Exception:
-            # Widget was destroyed, ignore
+            self._complete_after_id = self.after(0, self._on_playback_complete)
+        except (RuntimeError, tk.TclError):
+            # Main loop already gone (application shutting down)
             pass
     
+    def _on_destroy(self) -> None:
+        """Cancel pending completion handling when the widget is destroyed."""
+        self._destroyed = True
+        if self._complete_after_id is not None:
+            try:
+                self.after_cancel(self._complete_after_id)
+            except tk.TclError:
+                pass
+            self._complete_after_id = None
+    
+    def _on_playback_complete(self) -> None:
+        """Handle playback completion (on the Tk thread)."""
+        self._complete_after_id = None
+        
+        # The audio thread may have queued this just before the widget was destroyed
+        if self._destroyed:
+            return
+        
+        # stop() and the audio thread can both report completion; draw it once
+        if not self._showing_playback:
+            return
+        self._showing_playback = False
+        
+        self.play_button.configure(text="▶ Play")
+        if self._ready_text is not None:
+            self.status_label.configure(text=self._ready_text)
+    
     def _update_ui(self) -> None:
         """Update UI state."""
         if self.current_audio is None:
@@ -132,13 +194,19 @@ class FilePickerWidget(ctk.CTkFrame):
         """
         super().__init__(parent, **kwargs)
         
-        self.filetypes = filetypes or [("All files", "*.*")]
-        self.callback = callback
+        self.filetypes = filetypes if filetypes is not None else _DEFAULT_FILETYPES
+        self.callback = callback or _noop
         self.selected_file = None
+        self._label_text = label
+        self._dialog_title = f"Select {label}"
+        self._shown_filename = None  # File name currently in path_label
+        
+        # Path column takes the spare width
+        self.columnconfigure(1, weight=1)
         
         # Label
         self.label = ctk.CTkLabel(self, text=label, width=80)
-        self.label.pack(side="left", padx=5)
+        self.label.grid(row=0, column=0, padx=5)
         
         # File path display
         self.path_label = ctk.CTkLabel(
@@ -147,7 +215,7 @@ class FilePickerWidget(ctk.CTkFrame):
             width=300,
             anchor="w"
         )
-        self.path_label.pack(side="left", padx=5, fill="x", expand=True)
+        self.path_label.grid(row=0, column=1, padx=5, sticky="ew")
         
         # Browse button
         self.browse_button = ctk.CTkButton(
@@ -156,17 +224,22 @@ class FilePickerWidget(ctk.CTkFrame):
             command=self._browse,
             width=100
         )
-        self.browse_button.pack(side="right", padx=5)
+        self.browse_button.grid(row=0, column=2, padx=5)
     
     def _browse(self) -> None:
         """Open file dialog."""
+        from tkinter import filedialog
+        
+        # Flush pending redraws so the window is current while the modal dialog blocks
+        self.update_idletasks()
         filepath = filedialog.askopenfilename(
-            title=f"Select {self.label.cget('text')}",
+            title=self._dialog_title,
             filetypes=self.filetypes
         )
         
         if filepath:
-            self.set_file(filepath)
+            # Apply from the main loop so callbacks queued during the dialog run first
+            self.after(0, self.set_file, filepath)
     
     def set_file(self, filepath: str) -> None:
         """Set selected file.
@@ -175,11 +248,12 @@ class FilePickerWidget(ctk.CTkFrame):
             filepath: Path to file
         """
         self.selected_file = filepath
-        filename = Path(filepath).name
-        self.path_label.configure(text=filename)
+        filename = os.path.basename(filepath)
+        if filename != self._shown_filename:
+            self._shown_filename = filename
+            self.path_label.configure(text=filename)
         
-        if self.callback:
-            self.callback(filepath)
+        self.callback(filepath)
     
     def get_file(self) -> Optional[str]:
         """Get selected file path.
@@ -192,6 +266,7 @@ class FilePickerWidget(ctk.CTkFrame):
     def clear(self) -> None:
         """Clear selected file."""
         self.selected_file = None
+        self._shown_filename = None
         self.path_label.configure(text="No file selected")
 
 
@@ -224,132 +299,299 @@ class VoiceLibraryItem(ctk.CTkFrame):
         self.on_delete = on_delete
         self.on_play = on_play
         
-        # Voice name and info
-        name_text = voice_data.get("name", "Unknown")
-        voice_type = voice_data.get("type", "")
-        info_text = f"{name_text} ({voice_type})"
+        # Name column takes the spare width so the buttons stay right-aligned
+        self.columnconfigure(0, weight=1)
         
+        info_text, tags_text = self._compute_display(voice_data)
+        
+        # Voice name and info
         self.name_label = ctk.CTkLabel(
             self,
             text=info_text,
             width=200,
             anchor="w"
         )
-        self.name_label.pack(side="left", padx=5)
+        self.name_label.grid(row=0, column=0, padx=5, sticky="w")
         
         # Tags
-        tags = voice_data.get("tags", [])
-        if tags:
-            tags_text = ", ".join(tags[:3])  # Show first 3 tags
+        if tags_text:
             self.tags_label = ctk.CTkLabel(
                 self,
-                text=f"[{tags_text}]",
+                text=tags_text,
                 width=150,
                 anchor="w",
                 text_color="gray"
             )
-            self.tags_label.pack(side="left", padx=5)
+            self.tags_label.grid(row=0, column=1, padx=5)
         
         # Buttons
-        if on_play:
-            self.play_button = ctk.CTkButton(
+        if on_load:
+            self.load_button = ctk.CTkButton(
                 self,
-                text="▶",
-                command=lambda: on_play(voice_data),
-                width=40
+                text="Load",
+                command=self._load,
+                width=60
             )
-            self.play_button.pack(side="right", padx=2)
+            self.load_button.grid(row=0, column=2, padx=2)
         
         if on_delete:
             self.delete_button = ctk.CTkButton(
                 self,
                 text="Delete",
-                command=lambda: on_delete(voice_data),
+                command=self._delete,
                 width=60,
                 fg_color="darkred"
             )
-            self.delete_button.pack(side="right", padx=2)
+            self.delete_button.grid(row=0, column=3, padx=2)
         
-        if on_load:
-            self.load_button = ctk.CTkButton(
+        if on_play:
+            self.play_button = ctk.CTkButton(
                 self,
-                text="Load",
-                command=lambda: on_load(voice_data),
-                width=60
+                text="▶",
+                command=self._play,
+                width=40
             )
-            self.load_button.pack(side="right", padx=2)
+            self.play_button.grid(row=0, column=4, padx=2)
+    
+    @staticmethod
+    def _compute_display(voice_data: dict) -> Tuple[str, str]:
+        """Build the display strings for a voice.
+        
+        Args:
+            voice_data: Voice metadata dictionary
+            
+        Returns:
+            Tuple of (info_text, tags_text); tags_text is empty if there are no tags
+        """
+        info_text = f"{voice_data.get('name', 'Unknown')} ({voice_data.get('type', '')})"
+        tags = voice_data.get("tags", [])
+        tags_text = f"[{', '.join(tags[:3])}]" if tags else ""  # Show first 3 tags
+        return info_text, tags_text
+    
+    def _load(self) -> None:
+        """Handle load button click."""
+        self.on_load(self.voice_data)
+    
+    def _delete(self) -> None:
+        """Handle delete button click."""
+        self.on_delete(self.voice_data)
+    
+    def _play(self) -> None:
+        """Handle play button click."""
+        self.on_play(self.voice_data)
 
 
-class LoadingOverlay(ctk.CTkToplevel):
-    """Modal loading dialog with progress indicator."""
+class LoadingOverlay(ctk.CTkFrame):
+    """Modal loading overlay with progress indicator.
+    
+    Drawn as a frame placed over the parent's window rather than a separate
+    toplevel, so showing it costs no window-manager round-trips. While placed
+    it covers the whole window, which keeps clicks away from the widgets below.
+    
+    The overlay never pumps the event loop itself. The work it reports on
+    must run off the UI thread (see utils.threading_helpers.run_in_thread)
+    so the main loop stays free to redraw it.
+    """
+    
+    REDRAW_INTERVAL_MS = 33  # Flush pending progress at most ~30 times per second
+    SHOW_DELAY_MS = 150  # Build and show the overlay if no progress arrives sooner
+    MIN_PROGRESS_STEP = 1.0  # Percentage change needed to repaint the progress bar
     
     def __init__(self, parent, title: str = "Loading...", message: str = "Please wait..."):
         """Initialize loading overlay.
         
+        The overlay starts hidden; its widgets are built on the first progress
+        flush, or after SHOW_DELAY_MS, so steps that finish quickly never pay for them.
+        
         Args:
-            parent: Parent window
-            title: Window title
+            parent: Widget whose window the overlay covers
+            title: Overlay heading
             message: Loading message
         """
-        super().__init__(parent)
+        colors = get_theme_colors()
+        super().__init__(parent.winfo_toplevel(), fg_color=colors["overlay_bg"], corner_radius=0)
         
-        self.title(title)
-        self.geometry("400x150")
-        self.resizable(False, False)
+        self._title = title
+        self._message = message
+        self._built = False
         
-        # Center on parent
-        self.transient(parent)
-        self.grab_set()
+        # Latest progress not yet drawn; update_progress only records it
+        self._pending_pct = 0.0
+        self._pending_msg = ""
+        self._shown_msg = ""
+        self._shown_pct = 0.0
+        self._redraw_scheduled = False
+        self._redraw_after_id = None
+        self._closed = False
+        self._pending_lock = threading.Lock()  # update_progress may be called from worker threads
+        
+        self._build_after_id = self.after(self.SHOW_DELAY_MS, self._ensure_built)
+    
+    def _ensure_built(self) -> None:
+        """Create the overlay widgets and show the overlay, once."""
+        self._build_after_id = None
+        if self._built:
+            return
+        self._built = True
+        
+        # Centered card holding the progress widgets
+        card = ctk.CTkFrame(self, width=400, height=170)
+        card.place(relx=0.5, rely=0.5, anchor="center")
+        
+        # Title
+        title_label = ctk.CTkLabel(
+            card,
+            text=self._title,
+            font=get_font(16, "bold")
+        )
+        title_label.pack(padx=40, pady=(15, 0))
         
         # Message
         self.message_label = ctk.CTkLabel(
-            self,
-            text=message,
-            font=("Arial", 14)
+            card,
+            text=self._message,
+            font=get_font(14)
         )
-        self.message_label.pack(pady=20)
+        self.message_label.pack(padx=40, pady=(5, 10))
         
         # Progress bar
-        self.progress_bar = ctk.CTkProgressBar(self, width=300)
-        self.progress_bar.pack(pady=10)
+        self.progress_bar = ctk.CTkProgressBar(card, width=300)
+        self.progress_bar.pack(padx=40, pady=10)
         self.progress_bar.set(0)
         
         # Status
         self.status_label = ctk.CTkLabel(
-            self,
+            card,
             text="Initializing...",
-            font=("Arial", 10),
+            font=get_font(10),
             text_color="gray"
         )
-        self.status_label.pack(pady=5)
+        self.status_label.pack(padx=40, pady=(5, 15))
         
-        # Center window
-        self.update_idletasks()
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - (self.winfo_width() // 2)
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - (self.winfo_height() // 2)
-        self.geometry(f"+{x}+{y}")
+        # Cover the whole window and take keyboard focus from the widgets below
+        self.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self.lift()
+        self.focus_set()
     
     def update_progress(self, percentage: float, message: str = "") -> None:
         """Update progress.
         
+        Updates are coalesced: only the latest value is drawn, at most once
+        per REDRAW_INTERVAL_MS, and the main loop does the actual redraw.
+        
         Args:
             percentage: Progress percentage (0-100)
             message: Status message
         """
-        self.progress_bar.set(percentage / 100.0)
-        if message:
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._pending_pct = percentage
+            if message:
+                self._pending_msg = message
+            
+            # At most one flush is ever queued, whichever thread reports progress
+            if self._redraw_scheduled:
+                return
+            self._redraw_scheduled = True
+        
+        self._redraw_after_id = self.after(self.REDRAW_INTERVAL_MS, self._flush_progress)
+    
+    def _flush_progress(self) -> None:
+        """Draw the latest pending progress."""
+        with self._pending_lock:
+            self._redraw_scheduled = False
+            self._redraw_after_id = None
+            if self._closed:
+                return
+            percentage, message = self._pending_pct, self._pending_msg
+        
+        self._ensure_built()
+        
+        # The bar repaints its whole canvas, so skip sub-percent changes (but always show 100%)
+        if abs(percentage - self._shown_pct) >= self.MIN_PROGRESS_STEP or (percentage >= 100 > self._shown_pct):
+            self._shown_pct = percentage
+            self.progress_bar.set(percentage / 100.0)
+        if message and message != self._shown_msg:
+            self._shown_msg = message
             self.status_label.configure(text=message)
-        self.update()
     
     def close(self) -> None:
         """Close the overlay."""
-        self.grab_release()
+        with self._pending_lock:
+            self._closed = True
+        if self._build_after_id is not None:
+            self.after_cancel(self._build_after_id)
+            self._build_after_id = None
+        if self._redraw_after_id is not None:
+            self.after_cancel(self._redraw_after_id)
+            self._redraw_after_id = None
+        self.place_forget()
+        self.destroy()
+
+
+class ToastOverlay(ctk.CTkFrame):
+    """Non-blocking notification banner that dismisses itself."""
+    
+    def __init__(self, parent, text: str, style: str = "error", timeout_ms: int = 5000):
+        """Initialize and show toast overlay.
+        
+        Args:
+            parent: Parent window the toast is placed over
+            text: Message to display
+            style: Color style ("error", "warning", "success" or "info")
+            timeout_ms: Time before the toast dismisses itself
+        """
+        colors = get_theme_colors()
+        super().__init__(parent, fg_color=colors[f"{style}_bg"], corner_radius=8)
+        
+        # Message
+        self.message_label = ctk.CTkLabel(
+            self,
+            text=text,
+            text_color=colors[f"{style}_text"],
+            font=get_font(12),
+            justify="left",
+            wraplength=500
+        )
+        self.message_label.pack(side="left", padx=(15, 5), pady=10)
+        
+        # Dismiss button
+        self.close_button = ctk.CTkButton(
+            self,
+            text="✕",
+            width=28,
+            fg_color="transparent",
+            hover_color=colors["row_selected"],
+            text_color=colors[f"{style}_text"],
+            command=self.dismiss
+        )
+        self.close_button.pack(side="right", padx=5, pady=10)
+        
+        # Float over the top of the parent without disturbing its layout
+        self.place(relx=0.5, y=10, anchor="n")
+        self.lift()
+        self._after_id = self.after(timeout_ms, self.dismiss)
+    
+    def dismiss(self) -> None:
+        """Remove the toast."""
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
         self.destroy()
 
 
 class SegmentListRow(ctk.CTkFrame):
     """Widget for displaying a transcript segment with voice selector."""
     
+    # (attribute, row, column, sticky, pady) for each cell of the 2x2 grid, shared by all rows
+    _CELL_LAYOUT = (
+        ("id_label", 0, 0, "w", (8, 4)),
+        ("text_label", 0, 1, "w", (8, 4)),
+        ("voice_label", 1, 0, "w", (4, 8)),
+        ("select_button", 1, 1, "e", (4, 8)),
+    )
+    
     def __init__(
         self,
         parent,
@@ -380,22 +622,18 @@ class SegmentListRow(ctk.CTkFrame):
         # Get theme colors
         colors = get_theme_colors()
         
-        # Configure 2x2 grid
-        self.columnconfigure(0, weight=1)  # Left column
-        self.columnconfigure(1, weight=1)  # Right column
-        self.rowconfigure(0, weight=0)     # Top row
-        self.rowconfigure(1, weight=0)     # Bottom row
+        # Configure 2x2 grid: both columns stretch, rows keep natural height
+        self.columnconfigure((0, 1), weight=1)
         
         # Upper left: Segment number as "X of Y" in colored text
         segment_text = f"({segment_id + 1} of {total_segments})"
         self.id_label = ctk.CTkLabel(
             self,
             text=segment_text,
-            font=("Arial", 12, "bold"),
+            font=get_font(12, "bold"),
             text_color=segment_color,
             anchor="w"
         )
-        self.id_label.grid(row=0, column=0, sticky="w", padx=10, pady=(8, 4))
         
         # Upper right: Text preview (first 30 chars, trailing "...")
         display_text = text_preview[:30] + "..." if len(text_preview) > 30 else text_preview
@@ -403,9 +641,8 @@ class SegmentListRow(ctk.CTkFrame):
             self,
             text=display_text,
             anchor="w",
-            font=("Arial", 11)
+            font=get_font(11)
         )
-        self.text_label.grid(row=0, column=1, sticky="w", padx=10, pady=(8, 4))
         
         # Lower left: Assigned voice or "Not assigned"
         self.voice_label = ctk.CTkLabel(
@@ -413,9 +650,8 @@ class SegmentListRow(ctk.CTkFrame):
             text="Not assigned",
             text_color=colors["text_secondary"],
             anchor="w",
-            font=("Arial", 11)
+            font=get_font(11)
         )
-        self.voice_label.grid(row=1, column=0, sticky="w", padx=10, pady=(4, 8))
         
         # Lower right: Select voice button
         self.select_button = ctk.CTkButton(
@@ -424,7 +660,49 @@ class SegmentListRow(ctk.CTkFrame):
             width=120,
             command=self._on_button_clicked
         )
-        self.select_button.grid(row=1, column=1, sticky="e", padx=10, pady=(4, 8))
+        
+        # Lay out all four cells in one pass once they exist
+        for name, row, column, sticky, pady in self._CELL_LAYOUT:
+            getattr(self, name).grid(row=row, column=column, sticky=sticky, padx=10, pady=pady)
+        
+        # Last values written to the labels, so rebinding skips unchanged ones
+        self._shown_id = (segment_text, segment_color)
+        self._shown_preview = display_text
+        self._shown_voice_text = "Not assigned"
+    
+    def configure_data(
+        self,
+        segment_id: int,
+        text_preview: str,
+        total_segments: int,
+        segment_color: str,
+        voice_data: Optional[dict] = None
+    ) -> None:
+        """Rebind this row to another segment, updating widgets in place.
+        
+        Args:
+            segment_id: Segment ID
+            text_preview: Preview of segment text
+            total_segments: Total number of segments
+            segment_color: Color for segment number display
+            voice_data: Assigned voice data, or None if not assigned
+        """
+        self.segment_id = segment_id
+        
+        id_state = (f"({segment_id + 1} of {total_segments})", segment_color)
+        if id_state != self._shown_id:
+            self._shown_id = id_state
+            self.id_label.configure(text=id_state[0], text_color=segment_color)
+        
+        display_text = text_preview[:30] + "..." if len(text_preview) > 30 else text_preview
+        if display_text != self._shown_preview:
+            self._shown_preview = display_text
+            self.text_label.configure(text=display_text)
+        
+        if voice_data is not None:
+            self.set_voice(voice_data)
+        else:
+            self.clear_voice()
     
     def _on_button_clicked(self) -> None:
         """Handle select button click."""
@@ -438,12 +716,24 @@ class SegmentListRow(ctk.CTkFrame):
             voice_data: Voice data dictionary with 'name' and 'type'
         """
         self.selected_voice_data = voice_data
-        colors = get_theme_colors()
         voice_name = voice_data['name']
         voice_type = voice_data.get('type', 'cloned')
         display_text = f"Assigned: {voice_name} ({voice_type})"
+        if display_text == self._shown_voice_text:
+            return
+        self._shown_voice_text = display_text
+        colors = get_theme_colors()
         self.voice_label.configure(text=display_text, text_color=colors["text_primary"])
     
+    def clear_voice(self) -> None:
+        """Reset the row to the "Not assigned" state."""
+        self.selected_voice_data = None
+        if self._shown_voice_text == "Not assigned":
+            return
+        self._shown_voice_text = "Not assigned"
+        colors = get_theme_colors()
+        self.voice_label.configure(text="Not assigned", text_color=colors["text_secondary"])
+    
     def get_selected_voice(self) -> Optional[dict]:
         """Get currently selected voice data.
         
@@ -453,67 +743,209 @@ class SegmentListRow(ctk.CTkFrame):
         return self.selected_voice_data
 
 
-class ColoredSegmentLabel(ctk.CTkFrame):
-    """Widget for displaying a colored text segment in the preview panel."""
+class RecycledListView(ctk.CTkScrollableFrame):
+    """Scrollable list that recycles a small pool of row widgets.
+    
+    Only the rows inside the viewport exist as widgets; scrolling rebinds them
+    to different items instead of creating new ones. A spacer sized to the
+    full list keeps the scrollbar geometry correct. All rows share one height,
+    measured from the first row built.
+    
+    Rows are built and filled by the create_row and bind_row callables.
+    """
+    
+    ROW_PAD = 5  # Vertical/horizontal padding around each row
     
     def __init__(
         self,
         parent,
-        segment_number: Optional[int],
-        total_segments: Optional[int],
-        text_content: str,
-        color: str,
-        on_click: Optional[Callable] = None,
+        create_row: Callable[[], object],
+        bind_row: Callable[[object, int, object], None],
         **kwargs
     ):
-        """Initialize colored segment label.
+        """Initialize recycled list view.
         
         Args:
             parent: Parent widget
-            segment_number: Segment number (None for speaker mode)
-            total_segments: Total segments (None for speaker mode)
-            text_content: Text to display
-            color: Color for the text
-            on_click: Callback when clicked
-            **kwargs: Additional frame arguments
+            create_row: Returns one new pooled row widget (child of this view)
+            bind_row: Callback(row, index, item) that shows an item in a pooled row
+            **kwargs: Additional scrollable frame arguments
         """
-        super().__init__(parent, fg_color="transparent", **kwargs)
+        super().__init__(parent, **kwargs)
         
-        self.on_click = on_click
+        self._create_row = create_row
+        self._bind_row = bind_row
+        self._items: Sequence = []
+        self._pool: list = []
+        self._pool_index: List[Optional[int]] = []  # Item index shown by each pooled row, None if hidden
+        self._row_height = 0
+        self._first_visible = -1
         
-        # Get theme colors
-        colors = get_theme_colors()
+        # Spacer gives the inner frame the height of the whole list
+        self._spacer = tk.Frame(self, width=1, height=1, highlightthickness=0, bd=0)
+        self._spacer.pack(anchor="nw")
         
-        # Create container that can be clicked
-        container = ctk.CTkFrame(self, fg_color="transparent", cursor="hand2" if on_click else "arrow")
-        container.pack(fill="x", pady=2)
+        # Rebind rows whenever the viewport moves or resizes
+        self._parent_canvas.configure(yscrollcommand=self._on_yscroll)
+        self._parent_canvas.bind("<Configure>", lambda e: self._refresh(), add="+")
+    
+    def set_items(self, items: Sequence) -> None:
+        """Replace the displayed items and scroll back to the top.
         
-        if on_click:
-            container.bind("<Button-1>", lambda e: on_click())
+        Args:
+            items: Items in display order, passed one at a time to bind_row
+        """
+        self._items = items
+        self._first_visible = -1
+        self._parent_canvas.yview_moveto(0)
+        self._ensure_pool(1)
+        self._spacer.configure(height=max(1, len(self._items) * self._row_height))
+        self._refresh()
+    
+    def clear(self) -> None:
+        """Remove all items."""
+        self.set_items([])
+    
+    def bound_rows(self) -> Iterator[Tuple[object, int]]:
+        """Iterate over pooled rows that currently show an item.
         
-        # Segment number prefix (if provided)
-        if segment_number is not None and total_segments is not None:
-            prefix = f"({segment_number} of {total_segments}) "
-        else:
-            prefix = ""
+        Yields:
+            (row widget, item index) pairs
+        """
+        for row, index in zip(self._pool, self._pool_index):
+            if index is not None:
+                yield row, index
+    
+    def _ensure_pool(self, size: int) -> None:
+        """Grow the row pool to at least the given size.
+        
+        Args:
+            size: Minimum number of pooled rows
+        """
+        while len(self._pool) < size:
+            row = self._create_row()
+            self._pool.append(row)
+            self._pool_index.append(None)
+            
+            # Measure the row height once, from the first row built
+            if not self._row_height:
+                row.update_idletasks()
+                self._row_height = row.winfo_reqheight() + 2 * self.ROW_PAD
+    
+    def _on_yscroll(self, first: str, last: str) -> None:
+        """Forward canvas scroll updates to the scrollbar and rebind visible rows."""
+        self._scrollbar.set(first, last)
+        self._refresh()
+    
+    def _refresh(self) -> None:
+        """Bind pooled rows to the items currently inside the viewport."""
+        if not self._row_height:
+            return
         
-        # Truncate long text
-        max_length = 150
-        display_text = prefix + (text_content[:max_length] + "..." if len(text_content) > max_length else text_content)
+        top = self._parent_canvas.canvasy(0)
+        first = max(0, int(top // self._row_height))
+        visible = self._parent_canvas.winfo_height() // self._row_height + 2
+        pool_size = len(self._pool)
+        self._ensure_pool(visible)
         
-        # Colored text label
-        text_label = ctk.CTkLabel(
-            container,
-            text=display_text,
-            text_color=color,
-            font=("Arial", 11),
-            anchor="w",
-            justify="left"
+        if first == self._first_visible and len(self._pool) == pool_size:
+            return
+        self._first_visible = first
+        
+        total = len(self._items)
+        for slot, row in enumerate(self._pool):
+            index = first + slot
+            if index < total:
+                self._bind_row(row, index, self._items[index])
+                self._pool_index[slot] = index
+                row.place(
+                    x=self.ROW_PAD,
+                    y=index * self._row_height + self.ROW_PAD,
+                    relwidth=1.0,
+                    width=-2 * self.ROW_PAD,
+                    height=self._row_height - 2 * self.ROW_PAD
+                )
+            elif self._pool_index[slot] is not None:
+                self._pool_index[slot] = None
+                row.place_forget()
+
+
+class SegmentListView(RecycledListView):
+    """Segment list for manual voice assignment, backed by recycled SegmentListRow widgets."""
+    
+    def __init__(self, parent, on_voice_select: Optional[Callable] = None, **kwargs):
+        """Initialize segment list view.
+        
+        Args:
+            parent: Parent widget
+            on_voice_select: Callback(segment_id) when a row's select button is clicked
+            **kwargs: Additional scrollable frame arguments
+        """
+        self.on_voice_select = on_voice_select
+        self._voices: Dict[int, dict] = {}
+        super().__init__(parent, create_row=self._new_row, bind_row=self._show_segment, **kwargs)
+    
+    def set_segments(self, items: List[Tuple[int, str, str]], voices: Optional[Dict[int, dict]] = None) -> None:
+        """Replace the displayed segments.
+        
+        Args:
+            items: (segment_id, text_preview, segment_color) per segment, in display order
+            voices: Optional mapping of segment_id to assigned voice data
+        """
+        self._voices = dict(voices) if voices else {}
+        self.set_items(list(items))
+    
+    def set_voice(self, segment_id: int, voice_data: dict) -> None:
+        """Record a voice assignment and update the row showing it, if any.
+        
+        Args:
+            segment_id: Segment ID
+            voice_data: Assigned voice data
+        """
+        self._voices[segment_id] = voice_data
+        for row, index in self.bound_rows():
+            if self._items[index][0] == segment_id:
+                row.set_voice(voice_data)
+    
+    def _new_row(self) -> SegmentListRow:
+        """Create one pooled segment row."""
+        return SegmentListRow(
+            self,
+            segment_id=-1,
+            text_preview="",
+            total_segments=0,
+            segment_color="gray",
+            on_voice_select=self.on_voice_select
         )
-        text_label.pack(fill="x", padx=5, pady=2)
+    
+    def _show_segment(self, row: SegmentListRow, index: int, item: Tuple[int, str, str]) -> None:
+        """Show a segment in a pooled row."""
+        segment_id, text_preview, segment_color = item
+        row.configure_data(segment_id, text_preview, len(self._items), segment_color, self._voices.get(segment_id))
+
+
+def build_display(
+    segment_number: Optional[int],
+    total_segments: Optional[int],
+    text: str,
+    max_length: int = 150
+) -> str:
+    """Build a segment's preview line: optional "(N of M)" prefix plus capped text.
+    
+    Args:
+        segment_number: Segment number (None for speaker mode)
+        total_segments: Total segments (None for speaker mode)
+        text: Segment text
+        max_length: Maximum text length before "..." is appended
         
-        if on_click:
-            text_label.bind("<Button-1>", lambda e: on_click())
+    Returns:
+        Display text
+    """
+    if len(text) > max_length:
+        text = f"{text[:max_length]}..."
+    if segment_number is None or total_segments is None:
+        return text
+    return f"({segment_number} of {total_segments}) {text}"
 
 
 class ColoredPreviewWindow(ctk.CTkToplevel):
@@ -526,7 +958,8 @@ class ColoredPreviewWindow(ctk.CTkToplevel):
         parser,
         colors: list,
         mode: str,
-        speaker_assignment_panel=None
+        speaker_assignment_panel=None,
+        on_segment_click: Optional[Callable[[int], None]] = None
     ):
         """Initialize colored preview window.
         
@@ -537,6 +970,7 @@ class ColoredPreviewWindow(ctk.CTkToplevel):
             colors: Color palette array
             mode: Current mode ("manual" or "annotated")
             speaker_assignment_panel: SpeakerAssignmentPanel (for annotated mode)
+            on_segment_click: Callback(segment_index) when a segment line is clicked
         """
         super().__init__(parent)
         
@@ -545,6 +979,11 @@ class ColoredPreviewWindow(ctk.CTkToplevel):
         self.colors = colors
         self.mode = mode
         self.speaker_assignment_panel = speaker_assignment_panel
+        self.on_segment_click = on_segment_click
+        self._shown_segments = 0  # Segments rendered as lines 1..N of the text box
+        
+        # Each speaker's color is looked up once
+        self._speaker_colors: Dict[str, str] = {}
         
         # Window configuration
         self.title("Colored Transcript Preview")
@@ -562,7 +1001,7 @@ class ColoredPreviewWindow(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             self,
             text="Colored Transcript Preview",
-            font=("Arial", 16, "bold")
+            font=get_font(16, "bold")
         )
         title.pack(pady=10)
         
@@ -572,12 +1011,18 @@ class ColoredPreviewWindow(ctk.CTkToplevel):
             self,
             text=f"Showing segments/speakers with matching colors from assignment list ({mode_text})",
             text_color="gray",
-            font=("Arial", 11)
+            font=get_font(11)
         )
         info.pack(pady=(0, 10))
         
-        # Scrollable frame for colored segments
-        self.content_frame = ctk.CTkScrollableFrame(self)
+        # One text widget holds every segment; colors are text tags, not widgets
+        self.content_frame = ctk.CTkTextbox(
+            self,
+            wrap="word",
+            font=get_font(11),
+            spacing1=3,
+            spacing3=3
+        )
         self.content_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Render colored content
@@ -593,63 +1038,86 @@ class ColoredPreviewWindow(ctk.CTkToplevel):
         close_btn.pack(pady=10)
     
     def _render_content(self) -> None:
-        """Render colored segments in the content frame."""
+        """Render colored segments in the content text box."""
+        textbox = self.content_frame
+        
         if len(self.segments) == 0:
-            empty_label = ctk.CTkLabel(
-                self.content_frame,
-                text="No segments to display",
-                text_color="gray",
-                font=("Arial", 12)
-            )
-            empty_label.pack(pady=20)
+            textbox.tag_config("empty", foreground="gray", justify="center")
+            textbox.insert("end", "\nNo segments to display", "empty")
+            textbox.configure(state="disabled")
             return
         
         # Limit to first 50 items for performance
         max_show = min(50, len(self.segments))
         
-        if self.mode == "manual":
-            # Segment mode: show each segment with its text
-            for i, segment in enumerate(self.segments[:max_show]):
-                segment_color = self.colors[i % len(self.colors)]
-                preview_text = self.parser.preview_segment(segment, max_length=150)
-                
-                # Create colored segment label
-                segment_label = ColoredSegmentLabel(
-                    self.content_frame,
-                    segment_number=i + 1,
-                    total_segments=len(self.segments),
-                    text_content=preview_text,
-                    color=segment_color,
-                    on_click=None  # No click action in window
-                )
-                segment_label.pack(fill="x", pady=3, padx=5)
-        
-        elif self.mode == "annotated":
-            # Speaker mode: display segments in original order with speaker colors
-            if self.speaker_assignment_panel:
-                for i, segment in enumerate(self.segments[:max_show]):
-                    # In annotated mode, the speaker name is stored in segment.voice
-                    speaker = segment.voice if segment.voice else "Unknown"
-                    speaker_color = self.speaker_assignment_panel.get_speaker_color(speaker)
-                    
-                    preview_text = self.parser.preview_segment(segment, max_length=150)
-                    
-                    segment_label = ColoredSegmentLabel(
-                        self.content_frame,
-                        segment_number=None,
-                        total_segments=None,
-                        text_content=preview_text,
-                        color=speaker_color,
-                        on_click=None
-                    )
-                    segment_label.pack(fill="x", pady=3, padx=5)
+        # Each mode pairs a describer with its color source; speaker mode needs the assignment panel
+        renderers = {"manual": (self._describe_numbered, cycle(self.colors))}
+        if self.speaker_assignment_panel:
+            renderers["annotated"] = (self._describe_by_speaker, repeat(None))
+        renderer = renderers.get(self.mode)
+        
+        if renderer is not None:
+            describe, palette = renderer
+            tags: Dict[str, str] = {}  # color -> tag name, one tag per distinct color
+            for i, (segment, segment_color) in enumerate(zip(islice(self.segments, max_show), palette)):
+                display_text, color = describe(i, segment, segment_color)
+                tag = tags.get(color)
+                if tag is None:
+                    tag = f"color{len(tags)}"
+                    tags[color] = tag
+                    textbox.tag_config(tag, foreground=color)
+                textbox.insert("end", display_text + "\n", tag)
+                self._shown_segments = i + 1
+            
+            # One binding for the whole text box; the click position picks the segment
+            if self.on_segment_click:
+                textbox.bind("<Button-1>", self._on_text_clicked)
         
         # Show "more" indicator if truncated
         if len(self.segments) > max_show:
-            more_label = ctk.CTkLabel(
-                self.content_frame,
-                text=f"... and {len(self.segments) - max_show} more segments",
-                text_color="gray",
-                font=("Arial", 11)
-            )
-            more_label.pack(pady=10)
+            textbox.tag_config("more", foreground="gray", justify="center", spacing1=10)
+            textbox.insert("end", f"... and {len(self.segments) - max_show} more segments", "more")
+        
+        textbox.configure(state="disabled")
+    
+    def _on_text_clicked(self, event) -> None:
+        """Map a click in the text box to the segment on that line."""
+        line = int(self.content_frame.index(f"@{event.x},{event.y}").split(".")[0])
+        index = line - 1
+        if index < self._shown_segments:
+            self.on_segment_click(index)
+    
+    def _describe_numbered(self, index: int, segment, segment_color: str) -> Tuple[str, str]:
+        """Describe a segment in segment mode: numbered, in its palette color.
+        
+        Args:
+            index: Segment position in the transcript
+            segment: Transcript segment
+            segment_color: Palette color for this segment
+            
+        Returns:
+            (display_text, color)
+        """
+        preview_text = self.parser.preview_segment(segment, max_length=150)
+        return build_display(index + 1, len(self.segments), preview_text), segment_color
+    
+    def _describe_by_speaker(self, index: int, segment, segment_color: None) -> Tuple[str, str]:
+        """Describe a segment in speaker mode: unnumbered, in its speaker's color.
+        
+        Args:
+            index: Segment position in the transcript (unused)
+            segment: Transcript segment
+            segment_color: Unused; speaker colors come from the assignment panel
+            
+        Returns:
+            (display_text, color)
+        """
+        preview_text = self.parser.preview_segment(segment, max_length=150)
+        
+        # In annotated mode, the speaker name is stored in segment.voice
+        speaker = segment.voice if segment.voice else "Unknown"
+        speaker_color = self._speaker_colors.get(speaker)
+        if speaker_color is None:
+            speaker_color = self.speaker_assignment_panel.get_speaker_color(speaker)
+            self._speaker_colors[speaker] = speaker_color
+        return build_display(None, None, preview_text), speaker_color
@@ -3,11 +3,127 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from pathlib import Path
-from typing import Optional, List, Dict
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Optional, Dict, Sequence, Tuple
 import os
 
 from utils.error_handler import logger
-from utils.theme import get_theme_colors
+from utils.theme import get_theme_colors, get_font
+from utils.threading_helpers import run_in_thread
+
+
+# Model choices offered by the dialog, in display order
+_MODEL_OPTIONS = (
+    {
+        "value": "1.7B",
+        "title": "Qwen3-TTS 1.7B (Recommended)",
+        "details": (
+            "Size: ~7 GB download",
+            "Quality: High",
+            "Speed: Moderate",
+            "VRAM: ~8 GB (GPU) / RAM: ~8 GB (CPU)",
+            "Best for: High-quality voices, production use"
+        ),
+        "can_recommend": True
+    },
+    {
+        "value": "0.6B",
+        "title": "Qwen3-TTS 0.6B (Faster)",
+        "details": (
+            "Size: ~3 GB download",
+            "Quality: Good",
+            "Speed: Fast",
+            "VRAM: ~3 GB (GPU) / RAM: ~4 GB (CPU)",
+            "Best for: Quick experiments, low-end hardware"
+        ),
+        "can_recommend": True
+    },
+    {
+        "value": "both",
+        "title": "Both Models",
+        "details": (
+            "Size: ~10 GB total download",
+            "Gives you flexibility to switch based on needs",
+            "Can choose which to use in Settings tab",
+            "Recommended if you have sufficient disk space"
+        ),
+        "can_recommend": True
+    },
+    {
+        "value": "skip",
+        "title": "Skip for Now",
+        "details": (
+            "Download models later from Settings tab",
+            "Application UI will be available",
+            "⚠ TTS features will be disabled until models are loaded",
+            "No disk space used now"
+        ),
+        "can_recommend": False
+    },
+)
+
+@lru_cache(maxsize=1)
+def _total_ram_bytes() -> int:
+    """Get total system RAM, read once per process since it cannot change.
+    
+    Returns:
+        Total physical memory in bytes
+    """
+    import psutil
+    return psutil.virtual_memory().total
+
+
+# Recommendation policy: (memory thresholds in GB, option for each band).
+# Memory at or above thresholds[i] selects options[i + 1].
+_CUDA_RECOMMENDATIONS = (
+    (6, 12),
+    ("0.6B", "1.7B", "both")  # Low VRAM / mid-range GPU / high-end GPU that can handle both
+)
+_CPU_RECOMMENDATIONS = (
+    (16,),
+    ("0.6B", "1.7B")  # Limited RAM / enough RAM for the larger model
+)
+
+# GPU probe results keyed by CUDA_VISIBLE_DEVICES, so a different device set is probed afresh
+_cuda_probe_cache: Dict[str, Tuple[bool, str, str, float]] = {}
+
+
+def _probe_cuda() -> Tuple[bool, str, str, float]:
+    """Query the visible GPUs and pick the one with the most memory.
+    
+    The CUDA driver calls behind this are slow, and the hardware does not
+    change while the app runs, so reopening the dialog reuses the result.
+    
+    Returns:
+        Tuple of (has_cuda, device, gpu_name, gpu_vram_gb)
+    """
+    visible = os.environ.get("CUDA_VISIBLE_DEVICES", "")
+    cached = _cuda_probe_cache.get(visible)
+    if cached is not None:
+        return cached
+    
+    import torch
+    
+    result = (False, "cpu", "N/A", 0)
+    
+    # CPU-only wheels have neither a CUDA nor a ROCm (HIP) version; checking
+    # first skips the driver probe entirely. ROCm builds also use torch.cuda.
+    gpu_build = (
+        getattr(torch.version, "cuda", None) is not None
+        or getattr(torch.version, "hip", None) is not None
+    )
+    if gpu_build and torch.cuda.is_available():
+        best_index, best_props = None, None
+        for i in range(torch.cuda.device_count()):
+            props = torch.cuda.get_device_properties(i)
+            if best_props is None or props.total_memory > best_props.total_memory:
+                best_index, best_props = i, props
+        if best_props is not None:
+            result = (True, f"cuda:{best_index}", best_props.name, best_props.total_memory / (1024**3))
+    
+    _cuda_probe_cache[visible] = result
+    return result
 
 
 class ModelSelectionDialog(ctk.CTkToplevel):
@@ -40,11 +156,15 @@ class ModelSelectionDialog(ctk.CTkToplevel):
         # State variables
         self.selection = ctk.StringVar(value="1.7B")
         
-        # Detect system capabilities
-        self.system_info = self._detect_system()
-        self.recommendation = self._get_recommendation()
+        # Filled in by background detection; importing torch can take seconds
+        self.system_info = None
+        self.recommendation = None
+        self._recommended_labels: Dict[str, ctk.CTkLabel] = {}
         
         self._create_ui()
+        
+        # Detect system capabilities off the UI thread so the dialog shows immediately
+        run_in_thread(self, self._detect_system, on_success=self._on_system_detected)
     
     def _detect_system(self) -> Dict:
         """Detect system GPU/CPU capabilities.
@@ -61,21 +181,16 @@ class ModelSelectionDialog(ctk.CTkToplevel):
         }
         
         try:
-            import torch
-            import psutil
-            
-            # Check CUDA availability
-            if torch.cuda.is_available():
+            # Check CUDA availability (cached for the process)
+            has_cuda, device, gpu_name, gpu_vram_gb = _probe_cuda()
+            if has_cuda:
                 info["has_cuda"] = True
-                info["device"] = "cuda:0"
-                info["gpu_name"] = torch.cuda.get_device_name(0)
-                
-                # Get VRAM in GB
-                gpu_props = torch.cuda.get_device_properties(0)
-                info["gpu_vram_gb"] = gpu_props.total_memory / (1024**3)
+                info["device"] = device
+                info["gpu_name"] = gpu_name
+                info["gpu_vram_gb"] = gpu_vram_gb
             
             # Get CPU RAM in GB
-            info["cpu_ram_gb"] = psutil.virtual_memory().total / (1024**3)
+            info["cpu_ram_gb"] = _total_ram_bytes() / (1024**3)
             
             logger.info(f"System detection: {info}")
             
@@ -84,6 +199,25 @@ class ModelSelectionDialog(ctk.CTkToplevel):
         
         return info
     
+    def _on_system_detected(self, info: Dict) -> None:
+        """Show detection results once the background probe finishes.
+        
+        Args:
+            info: Dictionary with system information
+        """
+        if not self.winfo_exists():
+            return
+        
+        self.system_info = info
+        self.recommendation = self._get_recommendation()
+        self._refresh_system_info_section()
+        
+        rec_label = self._recommended_labels.get(self.recommendation)
+        if rec_label is not None:
+            rec_label.pack(side="left", padx=10)
+        
+        self.continue_button.configure(state="normal")
+    
     def _get_recommendation(self) -> str:
         """Get recommended model based on system capabilities.
         
@@ -91,22 +225,14 @@ class ModelSelectionDialog(ctk.CTkToplevel):
             Recommended option: "1.7B", "0.6B", or "both"
         """
         if self.system_info["has_cuda"]:
-            vram = self.system_info["gpu_vram_gb"]
-            
-            if vram >= 12:
-                return "both"  # High-end GPU, can handle both
-            elif vram >= 6:
-                return "1.7B"  # Mid-range GPU, use larger model
-            else:
-                return "0.6B"  # Low VRAM, use smaller model
+            thresholds, options = _CUDA_RECOMMENDATIONS
+            memory_gb = self.system_info["gpu_vram_gb"]
         else:
             # CPU mode - check RAM
-            ram = self.system_info["cpu_ram_gb"]
-            
-            if ram >= 16:
-                return "1.7B"  # Enough RAM for larger model
-            else:
-                return "0.6B"  # Limited RAM, use smaller model
+            thresholds, options = _CPU_RECOMMENDATIONS
+            memory_gb = self.system_info["cpu_ram_gb"]
+        
+        return options[bisect_right(thresholds, memory_gb)]
     
     def _create_ui(self):
         """Create dialog UI."""
@@ -134,7 +260,7 @@ class ModelSelectionDialog(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             title_frame,
             text="🤖 Model Selection",
-            font=("Arial", 20, "bold")
+            font=get_font(20, "bold")
         )
         title.pack(pady=(10, 5))
         
@@ -142,7 +268,7 @@ class ModelSelectionDialog(ctk.CTkToplevel):
             title_frame,
             text="Choose which AI model(s) to download for voice synthesis.\n"
                  "You can change this later in Settings.",
-            font=("Arial", 12),
+            font=get_font(12),
             text_color="gray"
         )
         subtitle.pack(pady=(0, 10))
@@ -152,9 +278,22 @@ class ModelSelectionDialog(ctk.CTkToplevel):
         sys_frame = ctk.CTkFrame(self.scroll_frame)
         sys_frame.pack(fill="x", padx=10, pady=10)
         
-        title = ctk.CTkLabel(sys_frame, text="System Detection", font=("Arial", 14, "bold"))
+        title = ctk.CTkLabel(sys_frame, text="System Detection", font=get_font(14, "bold"))
         title.pack(anchor="w", padx=10, pady=(10, 5))
         
+        colors = get_theme_colors()
+        self.system_info_label = ctk.CTkLabel(
+            sys_frame,
+            text="Detecting system...",
+            font=get_font(11),
+            text_color=colors["info_text"],
+            anchor="w",
+            justify="left"
+        )
+        self.system_info_label.pack(anchor="w", padx=10, pady=(0, 10))
+    
+    def _refresh_system_info_section(self):
+        """Fill the system information section with detection results."""
         # Build info text
         if self.system_info["has_cuda"]:
             info_text = (
@@ -170,84 +309,20 @@ class ModelSelectionDialog(ctk.CTkToplevel):
                 f"✓ Device: CPU"
             )
         
-        colors = get_theme_colors()
-        info_label = ctk.CTkLabel(
-            sys_frame,
-            text=info_text,
-            font=("Arial", 11),
-            text_color=colors["info_text"],
-            anchor="w",
-            justify="left"
-        )
-        info_label.pack(anchor="w", padx=10, pady=(0, 10))
+        self.system_info_label.configure(text=info_text)
     
     def _create_model_options(self):
         """Create model selection options."""
         options_frame = ctk.CTkFrame(self.scroll_frame)
         options_frame.pack(fill="x", padx=10, pady=10)
         
-        title = ctk.CTkLabel(options_frame, text="Select Model(s)", font=("Arial", 14, "bold"))
+        title = ctk.CTkLabel(options_frame, text="Select Model(s)", font=get_font(14, "bold"))
         title.pack(anchor="w", padx=10, pady=(10, 5))
         
-        # Option 1: 1.7B Model
-        self._create_option(
-            options_frame,
-            value="1.7B",
-            title="Qwen3-TTS 1.7B (Recommended)",
-            details=[
-                "Size: ~7 GB download",
-                "Quality: High",
-                "Speed: Moderate",
-                f"VRAM: ~8 GB (GPU) / RAM: ~8 GB (CPU)",
-                "Best for: High-quality voices, production use"
-            ],
-            recommended=(self.recommendation == "1.7B")
-        )
-        
-        # Option 2: 0.6B Model
-        self._create_option(
-            options_frame,
-            value="0.6B",
-            title="Qwen3-TTS 0.6B (Faster)",
-            details=[
-                "Size: ~3 GB download",
-                "Quality: Good",
-                "Speed: Fast",
-                f"VRAM: ~3 GB (GPU) / RAM: ~4 GB (CPU)",
-                "Best for: Quick experiments, low-end hardware"
-            ],
-            recommended=(self.recommendation == "0.6B")
-        )
-        
-        # Option 3: Both Models
-        self._create_option(
-            options_frame,
-            value="both",
-            title="Both Models",
-            details=[
-                "Size: ~10 GB total download",
-                "Gives you flexibility to switch based on needs",
-                "Can choose which to use in Settings tab",
-                "Recommended if you have sufficient disk space"
-            ],
-            recommended=(self.recommendation == "both")
-        )
-        
-        # Option 4: Skip
-        self._create_option(
-            options_frame,
-            value="skip",
-            title="Skip for Now",
-            details=[
-                "Download models later from Settings tab",
-                "Application UI will be available",
-                "⚠ TTS features will be disabled until models are loaded",
-                "No disk space used now"
-            ],
-            recommended=False
-        )
+        for option in _MODEL_OPTIONS:
+            self._create_option(options_frame, **option)
     
-    def _create_option(self, parent, value: str, title: str, details: List[str], recommended: bool):
+    def _create_option(self, parent, value: str, title: str, details: Sequence[str], can_recommend: bool):
         """Create a single model option.
         
         Args:
@@ -255,7 +330,7 @@ class ModelSelectionDialog(ctk.CTkToplevel):
             value: Option value
             title: Option title
             details: List of detail strings
-            recommended: Whether this is the recommended option
+            can_recommend: Whether detection may mark this option as recommended
         """
         option_frame = ctk.CTkFrame(parent)
         option_frame.pack(fill="x", padx=10, pady=5)
@@ -269,26 +344,26 @@ class ModelSelectionDialog(ctk.CTkToplevel):
             text=title,
             variable=self.selection,
             value=value,
-            font=("Arial", 13, "bold")
+            font=get_font(13, "bold")
         )
         radio.pack(side="left")
         
-        if recommended:
+        if can_recommend:
+            # Packed by _on_system_detected if this turns out to be the recommendation
             colors = get_theme_colors()
-            rec_label = ctk.CTkLabel(
+            self._recommended_labels[value] = ctk.CTkLabel(
                 header_frame,
                 text="\u2b50 Recommended for your system",
-                font=("Arial", 11, "bold"),
+                font=get_font(11, "bold"),
                 text_color=colors["warning_text"]
             )
-            rec_label.pack(side="left", padx=10)
         
         # Details
         for detail in details:
             detail_label = ctk.CTkLabel(
                 option_frame,
                 text=f"  • {detail}",
-                font=("Arial", 10),
+                font=get_font(10),
                 text_color="gray",
                 anchor="w"
             )
@@ -312,16 +387,18 @@ class ModelSelectionDialog(ctk.CTkToplevel):
         )
         cancel_btn.pack(side="right", padx=5)
         
-        download_btn = ctk.CTkButton(
+        # Disabled until detection finishes, since the result records the device
+        self.continue_button = ctk.CTkButton(
             button_frame,
             text="✓ Continue",
             command=self._on_continue,
             width=180,
             height=40,
             fg_color="green",
-            font=("Arial", 14, "bold")
+            font=get_font(14, "bold"),
+            state="disabled"
         )
-        download_btn.pack(side="right", padx=5)
+        self.continue_button.pack(side="right", padx=5)
     
     def _on_cancel(self):
         """Handle cancel button."""
@@ -361,13 +438,22 @@ class ModelSelectionDialog(ctk.CTkToplevel):
         self.destroy()
 
 
-def show_model_selection_dialog() -> Optional[Dict]:
+def show_model_selection_dialog(parent=None) -> Optional[Dict]:
     """Show model selection dialog and return result.
     
+    Args:
+        parent: Existing window to open the dialog over. If None (first launch,
+            before the main window exists), a hidden temporary root is created.
+    
     Returns:
         Dictionary with model selection or None if cancelled
     """
-    # Create a temporary root window if needed
+    if parent is not None:
+        dialog = ModelSelectionDialog(parent)
+        parent.wait_window(dialog)
+        return dialog.result
+    
+    # Create a temporary root window
     root = ctk.CTk()
     root.withdraw()
     
@@ -1,11 +1,196 @@
 """Speaker assignment panel for annotated narration mode."""
 
+import tkinter as tk
 import customtkinter as ctk
-from typing import Dict, Callable, List, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import cycle
+from types import MappingProxyType
+from typing import Dict, Callable, Iterator, List, Mapping, Optional, Tuple
 from utils.error_handler import logger
-from utils.theme import get_theme_colors
+from utils.theme import get_theme_colors, get_font
+from gui.components import RecycledListView, bind_destroy
 from gui.voice_browser import VoiceBrowserWidget
 
+# Distinct colors handed out to speakers in order, repeating for large casts
+_SPEAKER_PALETTE = (
+    "#3b82f6",  # blue
+    "#ec4899",  # pink
+    "#10b981",  # green
+    "#f59e0b",  # amber
+    "#8b5cf6",  # violet
+    "#ef4444",  # red
+    "#14b8a6",  # teal
+    "#f97316",  # orange
+)
+
+
+class SpeakerRow(ctk.CTkFrame):
+    """Widget for displaying a speaker with its segment count and voice selector."""
+    
+    # (attribute, row, column, sticky, pady) for each cell of the 2x2 grid, shared by all rows
+    _CELL_LAYOUT = (
+        ("speaker_label", 0, 0, "w", (8, 4)),
+        ("count_label", 0, 1, "e", (8, 4)),
+        ("voice_label", 1, 0, "w", (4, 8)),
+        ("browse_button", 1, 1, "e", (4, 8)),
+    )
+    
+    def __init__(self, parent, on_browse: Callable[[str], None], **kwargs):
+        """Initialize speaker row.
+        
+        The row starts empty; configure_data() binds it to a speaker.
+        
+        Args:
+            parent: Parent widget
+            on_browse: Callback(speaker) when the select button is clicked
+            **kwargs: Additional frame arguments
+        """
+        super().__init__(parent, border_width=1, **kwargs)
+        
+        self.speaker = ""
+        self.on_browse = on_browse
+        
+        colors = get_theme_colors()
+        
+        # Configure 2x2 grid: both columns stretch, rows keep natural height
+        self.columnconfigure((0, 1), weight=1)
+        
+        # Upper left: Speaker name/number with colored text and position indicator
+        self.speaker_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=get_font(13, "bold"),
+            anchor="w"
+        )
+        
+        # Upper right: Segment count
+        self.count_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=get_font(11),
+            text_color=colors["text_secondary"],
+            anchor="e"
+        )
+        
+        # Lower left: Assigned voice or "Not assigned"
+        self.voice_label = ctk.CTkLabel(
+            self,
+            text="Not assigned",
+            font=get_font(11),
+            text_color=colors["text_secondary"],
+            anchor="w"
+        )
+        
+        # Lower right: Select Voice button
+        self.browse_button = ctk.CTkButton(
+            self,
+            text="Select Voice",
+            width=120,
+            command=self._on_button_clicked
+        )
+        
+        for name, row, column, sticky, pady in self._CELL_LAYOUT:
+            getattr(self, name).grid(row=row, column=column, sticky=sticky, padx=10, pady=pady)
+        
+        # Last values written to the labels, so rebinding skips unchanged ones
+        self._shown_speaker = None
+        self._shown_count = None
+        self._shown_voice_text = "Not assigned"
+    
+    def configure_data(
+        self,
+        speaker: str,
+        speaker_text: str,
+        color: str,
+        count_text: str,
+        voice_data: Optional[dict] = None
+    ) -> None:
+        """Rebind this row to a speaker, updating widgets in place.
+        
+        Args:
+            speaker: Speaker name
+            speaker_text: "(N of M) name" heading
+            color: Speaker color
+            count_text: Segment count text
+            voice_data: Assigned voice data, or None if not assigned
+        """
+        self.speaker = speaker
+        
+        if (speaker_text, color) != self._shown_speaker:
+            self._shown_speaker = (speaker_text, color)
+            self.speaker_label.configure(text=speaker_text, text_color=color)
+        
+        if count_text != self._shown_count:
+            self._shown_count = count_text
+            self.count_label.configure(text=count_text)
+        
+        self.set_voice(voice_data)
+    
+    def set_voice(self, voice_data: Optional[dict]) -> None:
+        """Show the assigned voice, or "Not assigned".
+        
+        Args:
+            voice_data: Voice data dictionary with 'name' and 'type', or None
+        """
+        if voice_data is None:
+            display_text, color_key = "Not assigned", "text_secondary"
+        else:
+            display_text = f"{voice_data['name']} ({voice_data.get('type', 'cloned')})"
+            color_key = "text_primary"
+        
+        if display_text == self._shown_voice_text:
+            return
+        self._shown_voice_text = display_text
+        colors = get_theme_colors()
+        self.voice_label.configure(text=display_text, text_color=colors[color_key])
+    
+    def _on_button_clicked(self) -> None:
+        """Handle select button click."""
+        self.on_browse(self.speaker)
+
+
+class SpeakerListView(RecycledListView):
+    """Speaker list for annotated mode, backed by recycled SpeakerRow widgets."""
+    
+    def __init__(
+        self,
+        parent,
+        assignments: Dict[str, dict],
+        on_browse: Callable[[str], None],
+        **kwargs
+    ):
+        """Initialize speaker list view.
+        
+        Args:
+            parent: Parent widget
+            assignments: Live speaker-to-voice mapping, read when rows are bound
+            on_browse: Callback(speaker) when a row's select button is clicked
+            **kwargs: Additional scrollable frame arguments
+        """
+        self._assignments = assignments
+        self.on_browse = on_browse
+        super().__init__(parent, create_row=self._new_row, bind_row=self._show_speaker, **kwargs)
+    
+    def refresh_voices(self, speaker: Optional[str] = None) -> None:
+        """Redraw the voice shown by bound rows after assignments change.
+        
+        Args:
+            speaker: Only refresh this speaker's row (all rows if None)
+        """
+        for row, index in self.bound_rows():
+            if speaker is None or row.speaker == speaker:
+                row.set_voice(self._assignments.get(row.speaker))
+    
+    def _new_row(self) -> SpeakerRow:
+        """Create one pooled speaker row."""
+        return SpeakerRow(self, on_browse=self.on_browse)
+    
+    def _show_speaker(self, row: SpeakerRow, index: int, item: Tuple[str, str, str, str]) -> None:
+        """Show a speaker in a pooled row."""
+        speaker, speaker_text, color, count_text = item
+        row.configure_data(speaker, speaker_text, color, count_text, self._assignments.get(speaker))
+
 
 class SpeakerAssignmentPanel(ctk.CTkFrame):
     """Panel for assigning voices to detected speakers."""
@@ -44,29 +229,36 @@ class SpeakerAssignmentPanel(ctk.CTkFrame):
         # Storage for speaker-to-voice assignments
         self.speaker_assignments: Dict[str, dict] = {}
         
+        # Validation refresh is coalesced into one idle callback, and held back
+        # entirely while batch_assign() is active
+        self._batch_depth = 0
+        self._validation_after_id = None
+        self._last_validation_text = None
+        
+        # Shared voice browser, created on first use and hidden between uses
+        self._voice_browser: Optional[VoiceBrowserWidget] = None
+        
         # Speaker color mapping for visual identification
-        self.speaker_colors = self._generate_speaker_colors()
+        self.speaker_colors = self._generate_speaker_colors(tuple(speakers))
         
         self._create_ui()
+        bind_destroy(self, self._on_destroy)
     
-    def _generate_speaker_colors(self) -> Dict[str, str]:
-        """Generate distinct colors for each speaker."""
-        colors = [
-            "#3b82f6",  # blue
-            "#ec4899",  # pink
-            "#10b981",  # green
-            "#f59e0b",  # amber
-            "#8b5cf6",  # violet
-            "#ef4444",  # red
-            "#14b8a6",  # teal
-            "#f97316",  # orange
-        ]
-        
-        color_map = {}
-        for i, speaker in enumerate(self.speakers):
-            color_map[speaker] = colors[i % len(colors)]
-        
-        return color_map
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _generate_speaker_colors(speakers: Tuple[str, ...]) -> Dict[str, str]:
+        """Generate distinct colors for each speaker.
+        
+        Cached per cast, so rebuilding the panel for the same speakers reuses
+        the mapping; treat the returned dictionary as read-only.
+        
+        Args:
+            speakers: Speaker names in display order
+            
+        Returns:
+            Dictionary mapping speaker names to colors
+        """
+        return dict(zip(speakers, cycle(_SPEAKER_PALETTE)))
     
     def _create_ui(self) -> None:
         """Create the speaker assignment table UI."""
@@ -76,7 +268,7 @@ class SpeakerAssignmentPanel(ctk.CTkFrame):
         title = ctk.CTkLabel(
             self,
             text="Speaker Voice Assignment",
-            font=("Arial", 14, "bold")
+            font=get_font(14, "bold")
         )
         title.grid(row=0, column=0, pady=(5, 10), sticky="w", padx=10)
         
@@ -85,101 +277,45 @@ class SpeakerAssignmentPanel(ctk.CTkFrame):
             self,
             text="Assign a voice to each detected speaker",
             text_color="gray",
-            font=("Arial", 11)
+            font=get_font(11)
         )
         info.grid(row=1, column=0, pady=(0, 10), sticky="w", padx=10)
         
-        # Scrollable frame for speaker rows (no headers)
-        self.rows_frame = ctk.CTkScrollableFrame(self, height=300)
+        # Scrollable list of speaker rows (no headers); only visible rows exist as widgets
+        self.rows_frame = SpeakerListView(
+            self,
+            assignments=self.speaker_assignments,
+            on_browse=self._browse_voice_for_speaker,
+            height=300
+        )
         self.rows_frame.grid(row=2, column=0, sticky="nsew", padx=10, pady=5)
-        self.rows_frame.columnconfigure(0, weight=1)
         self.rowconfigure(2, weight=1)
         
-        # Create rows for each speaker
-        self.speaker_rows = {}
-        for i, speaker in enumerate(self.speakers):
-            row = self._create_speaker_row(speaker, i)
-            self.speaker_rows[speaker] = row
+        total_speakers = len(self.speakers)
+        self.rows_frame.set_items([
+            (
+                speaker,
+                f"({i + 1} of {total_speakers}) {speaker}",
+                self.speaker_colors[speaker],
+                f"{self.segment_counts.get(speaker, 0)} segments"
+            )
+            for i, speaker in enumerate(self.speakers)
+        ])
         
-        # Validation status
+        # Validation status; text flows through a variable, color is set only when it changes
         colors = get_theme_colors()
+        self._validation_var = tk.StringVar(master=self, value="")
+        self._validation_color_key = "warning_text"
         self.validation_label = ctk.CTkLabel(
             self,
-            text="",
-            text_color=colors["warning_text"],
-            font=("Arial", 11)
+            textvariable=self._validation_var,
+            text_color=colors[self._validation_color_key],
+            font=get_font(11)
         )
         self.validation_label.grid(row=3, column=0, pady=(5, 10), padx=10)
         
         self._update_validation_status()
     
-    def _create_speaker_row(self, speaker: str, row_index: int) -> Dict:
-        """Create a 2x2 grid for a single speaker."""
-        # Main container frame for this speaker
-        row_frame = ctk.CTkFrame(self.rows_frame, border_width=1)
-        row_frame.grid(row=row_index, column=0, sticky="ew", pady=5, padx=5)
-        
-        # Configure 2x2 grid
-        row_frame.columnconfigure(0, weight=1)  # Left column
-        row_frame.columnconfigure(1, weight=1)  # Right column
-        row_frame.rowconfigure(0, weight=0)     # Top row
-        row_frame.rowconfigure(1, weight=0)     # Bottom row
-        
-        # Get speaker color and theme colors
-        color = self.speaker_colors[speaker]
-        colors = get_theme_colors()
-        
-        # Upper left: Speaker name/number with colored text and position indicator
-        speaker_number = row_index + 1
-        total_speakers = len(self.speakers)
-        speaker_text = f"({speaker_number} of {total_speakers}) {speaker}"
-        speaker_label = ctk.CTkLabel(
-            row_frame,
-            text=speaker_text,
-            font=("Arial", 13, "bold"),
-            text_color=color,
-            anchor="w"
-        )
-        speaker_label.grid(row=0, column=0, sticky="w", padx=10, pady=(8, 4))
-        
-        # Upper right: Segment count
-        count = self.segment_counts.get(speaker, 0)
-        count_label = ctk.CTkLabel(
-            row_frame,
-            text=f"{count} segments",
-            font=("Arial", 11),
-            text_color=colors["text_secondary"],
-            anchor="e"
-        )
-        count_label.grid(row=0, column=1, sticky="e", padx=10, pady=(8, 4))
-        
-        # Lower left: Assigned voice or "Not assigned"
-        voice_label = ctk.CTkLabel(
-            row_frame,
-            text="Not assigned",
-            font=("Arial", 11),
-            text_color=colors["text_secondary"],
-            anchor="w"
-        )
-        voice_label.grid(row=1, column=0, sticky="w", padx=10, pady=(4, 8))
-        
-        # Lower right: Select Voice button
-        browse_button = ctk.CTkButton(
-            row_frame,
-            text="Select Voice",
-            width=120,
-            command=lambda s=speaker: self._browse_voice_for_speaker(s)
-        )
-        browse_button.grid(row=1, column=1, sticky="e", padx=10, pady=(4, 8))
-        
-        return {
-            'frame': row_frame,
-            'speaker_label': speaker_label,
-            'count_label': count_label,
-            'voice_label': voice_label,
-            'browse_button': browse_button
-        }
-    
     def _browse_voice_for_speaker(self, speaker: str) -> None:
         """Open voice browser for a specific speaker."""
         logger.debug(f"Opening voice browser for speaker: {speaker}")
@@ -187,27 +323,36 @@ class SpeakerAssignmentPanel(ctk.CTkFrame):
         def on_voice_select(voice_data: dict) -> None:
             self._on_voice_assigned(speaker, voice_data)
         
-        browser = VoiceBrowserWidget(
+        # One browser is shared by every speaker row; it is hidden, not destroyed, between uses
+        if self._voice_browser is not None and self._voice_browser.winfo_exists():
+            self._voice_browser.show(on_select=on_voice_select)
+            return
+        
+        self._voice_browser = VoiceBrowserWidget(
             self,
             voice_library=self.voice_library,
             tts_engine=self.tts_engine,
             config=self.config,
-            on_select=on_voice_select
+            on_select=on_voice_select,
+            reusable=True
         )
-        browser.wait_window()
     
     def _on_voice_assigned(self, speaker: str, voice_data: dict) -> None:
         """Handle voice assignment to a speaker."""
-        self.speaker_assignments[speaker] = voice_data
-        colors = get_theme_colors()
+        # Re-assigning the same voice changes nothing; compare identity keys only,
+        # since voice data may carry extra, unhashable fields
+        current = self.speaker_assignments.get(speaker)
+        if (
+            current is not None
+            and current.get('name') == voice_data.get('name')
+            and current.get('type') == voice_data.get('type')
+        ):
+            return
         
-        # Update the UI
-        voice_name = voice_data['name']
-        voice_type = voice_data.get('type', 'cloned')
-        display_text = f"{voice_name} ({voice_type})"
+        self.speaker_assignments[speaker] = voice_data
         
-        row = self.speaker_rows[speaker]
-        row['voice_label'].configure(text=display_text, text_color=colors["text_primary"])
+        # Update the UI if the speaker's row is on screen
+        self.rows_frame.refresh_voices(speaker)
         
         # Update validation status
         self._update_validation_status()
@@ -216,39 +361,76 @@ class SpeakerAssignmentPanel(ctk.CTkFrame):
         if self.on_assignment_change:
             self.on_assignment_change(speaker, voice_data)
         
-        logger.info(f"Assigned voice '{voice_name}' to speaker '{speaker}'")
+        logger.info(f"Assigned voice '{voice_data['name']}' to speaker '{speaker}'")
     
     def _update_validation_status(self) -> None:
+        """Schedule a validation status refresh for the next idle moment.
+        
+        Any number of calls before then produce a single label update.
+        """
+        if self._batch_depth or self._validation_after_id is not None:
+            return
+        self._validation_after_id = self.after_idle(self._flush_validation_status)
+    
+    def _flush_validation_status(self) -> None:
         """Update validation status message."""
-        colors = get_theme_colors()
+        self._validation_after_id = None
+        
         assigned_count = len(self.speaker_assignments)
         total_count = len(self.speakers)
         
         if assigned_count == 0:
-            self.validation_label.configure(
-                text="⚠️ No voices assigned yet",
-                text_color=colors["warning_text"]
-            )
+            text, color_key = "⚠️ No voices assigned yet", "warning_text"
         elif assigned_count < total_count:
             remaining = total_count - assigned_count
-            self.validation_label.configure(
-                text=f"⚠️ {remaining} speaker(s) still need voice assignment",
-                text_color=colors["warning_text"]
-            )
+            text, color_key = f"⚠️ {remaining} speaker(s) still need voice assignment", "warning_text"
         else:
-            self.validation_label.configure(
-                text="✅ All speakers have voices assigned",
-                text_color=colors["success_text"]
-            )
+            text, color_key = "✅ All speakers have voices assigned", "success_text"
+        
+        # The text determines the color, so an unchanged text needs no redraw
+        if text == self._last_validation_text:
+            return
+        self._last_validation_text = text
+        self._validation_var.set(text)
+        
+        if color_key != self._validation_color_key:
+            self._validation_color_key = color_key
+            colors = get_theme_colors()
+            self.validation_label.configure(text_color=colors[color_key])
     
-    def get_assignments(self) -> Dict[str, dict]:
+    def _on_destroy(self) -> None:
+        """Cancel a pending validation refresh when the panel is destroyed."""
+        if self._validation_after_id is not None:
+            try:
+                self.after_cancel(self._validation_after_id)
+            except tk.TclError:
+                pass
+            self._validation_after_id = None
+    
+    @contextmanager
+    def batch_assign(self) -> Iterator[None]:
+        """Hold back the validation status while assigning many speakers.
+        
+        Example:
+            with panel.batch_assign():
+                for speaker, voice_data in pairs:
+                    panel.set_assignment(speaker, voice_data)
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self._update_validation_status()
+    
+    def get_assignments(self) -> Mapping[str, dict]:
         """
         Get all speaker-to-voice assignments.
         
         Returns:
-            Dictionary mapping speaker names to voice data dictionaries
+            Read-only live view mapping speaker names to voice data dictionaries
         """
-        return self.speaker_assignments.copy()
+        return MappingProxyType(self.speaker_assignments)
     
     def is_complete(self) -> bool:
         """Check if all speakers have voices assigned."""
@@ -268,13 +450,24 @@ class SpeakerAssignmentPanel(ctk.CTkFrame):
         
         self._on_voice_assigned(speaker, voice_data)
     
+    def set_assignments(self, assignments: Dict[str, dict]) -> None:
+        """
+        Programmatically set several voice assignments at once.
+        
+        Args:
+            assignments: Dictionary mapping speaker names to voice data dictionaries
+        """
+        with self.batch_assign():
+            for speaker, voice_data in assignments.items():
+                self.set_assignment(speaker, voice_data)
+    
     def clear_assignments(self) -> None:
         """Clear all voice assignments."""
-        self.speaker_assignments.clear()
-        colors = get_theme_colors()
+        if not self.speaker_assignments:
+            return
         
-        for speaker, row in self.speaker_rows.items():
-            row['voice_label'].configure(text="Not assigned", text_color=colors["text_secondary"])
+        self.speaker_assignments.clear()
+        self.rows_frame.refresh_voices()
         
         self._update_validation_status()
         logger.info("Cleared all speaker voice assignments")
@@ -4,8 +4,11 @@ import customtkinter as ctk
 from tkinter import filedialog, messagebox
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+import threading
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from utils.workspace_manager import WorkspaceManager
@@ -15,7 +18,7 @@ from core.audio_utils import save_audio, merge_audio_segments
 from utils.error_handler import logger, show_error_dialog
 from utils.threading_helpers import CancellableWorker, run_in_thread
 from utils.theme import get_theme_colors
-from gui.components import AudioPlayerWidget, SegmentListRow, ColoredPreviewWindow
+from gui.components import AudioPlayerWidget, SegmentListView, ColoredPreviewWindow
 from gui.voice_browser import VoiceBrowserWidget
 from gui.speaker_assignment import SpeakerAssignmentPanel
 
@@ -48,12 +51,12 @@ class NarrationTab(ctk.CTkFrame):
         # Speaker assignment panel for annotated mode
         self.speaker_assignment_panel = None
         
-        # Segment rows for manual mode
-        self.segment_rows = {}
-        
         # Colored preview button reference
         self.colored_preview_button = None
         
+        # Shared voice browser for per-segment assignment (created on first use)
+        self._segment_voice_browser: Optional[VoiceBrowserWidget] = None
+        
         self._create_ui()
         
         # Pack the frame into parent
@@ -271,6 +274,12 @@ class NarrationTab(ctk.CTkFrame):
         self.segments_frame = ctk.CTkScrollableFrame(self.assignment_left_frame)
         self.segments_frame.pack(fill="both", expand=True)
         
+        # Recycled segment list (for manual mode, packed on demand)
+        self.segment_list_view = SegmentListView(
+            self.assignment_left_frame,
+            on_voice_select=self._browse_voice_for_segment
+        )
+        
         # Mode explanation label in right frame
         self.mode_explanation_label = ctk.CTkLabel(
             self.assignment_right_frame,
@@ -527,16 +536,15 @@ class NarrationTab(ctk.CTkFrame):
         if self.speaker_assignment_panel:
             self.speaker_assignment_panel.pack_forget()
         
-        # Ensure segments frame is visible
-        self.segments_frame.pack(fill="both", expand=True)
-        
-        # Clear segments frame and segment rows storage
+        # Clear segments frame
         for widget in self.segments_frame.winfo_children():
             widget.destroy()
-        self.segment_rows = {}
         
         # Handle empty segments
         if len(self.segments) == 0:
+            self.segment_list_view.pack_forget()
+            self.segment_list_view.clear()
+            self.segments_frame.pack(fill="both", expand=True)
             colors = get_theme_colors()
             empty_label = ctk.CTkLabel(
                 self.segments_frame,
@@ -551,31 +559,18 @@ class NarrationTab(ctk.CTkFrame):
         # Get shared color palette for segments
         segment_colors = self._get_color_palette()
         
-        # Show first 50 segments (performance)
-        max_show = min(50, len(self.segments))
-        total_segments = len(self.segments)
-        for i, segment in enumerate(self.segments[:max_show]):
-            preview = self.parser.preview_segment(segment, max_length=80)
-            segment_color = segment_colors[i % len(segment_colors)]
-            row = SegmentListRow(
-                self.segments_frame,
+        # Show all segments; the list view only builds widgets for visible rows
+        items = [
+            (
                 segment.segment_id,
-                preview,
-                total_segments,
-                segment_color,
-                on_voice_select=self._browse_voice_for_segment
+                self.parser.preview_segment(segment, max_length=80),
+                segment_colors[i % len(segment_colors)]
             )
-            row.pack(fill="x", pady=5, padx=5)
-            self.segment_rows[segment.segment_id] = row
-        
-        if len(self.segments) > max_show:
-            colors = get_theme_colors()
-            more_label = ctk.CTkLabel(
-                self.segments_frame,
-                text=f"... and {len(self.segments) - max_show} more segments",
-                text_color=colors["text_secondary"]
-            )
-            more_label.pack(pady=10)
+            for i, segment in enumerate(self.segments)
+        ]
+        self.segments_frame.pack_forget()
+        self.segment_list_view.set_segments(items, voices=self.voice_mapping)
+        self.segment_list_view.pack(fill="both", expand=True)
         
         self._update_parse_status()
     
@@ -583,6 +578,7 @@ class NarrationTab(ctk.CTkFrame):
         """Show single voice assignment UI."""
         # Hide other panels
         self.segments_frame.pack_forget()
+        self.segment_list_view.pack_forget()
         if self.speaker_assignment_panel:
             self.speaker_assignment_panel.pack_forget()
         
@@ -745,6 +741,7 @@ class NarrationTab(ctk.CTkFrame):
         """Show empty state for annotated mode (no speakers detected or no text)."""
         # Hide other panels
         self.segments_frame.pack_forget()
+        self.segment_list_view.pack_forget()
         if self.speaker_assignment_panel:
             self.speaker_assignment_panel.destroy()
             self.speaker_assignment_panel = None
@@ -771,6 +768,7 @@ class NarrationTab(ctk.CTkFrame):
         """Show annotated mode speaker assignment UI."""
         # Hide segments frame and show speaker assignment panel
         self.segments_frame.pack_forget()
+        self.segment_list_view.pack_forget()
         
         # Destroy old speaker assignment panel if exists
         if self.speaker_assignment_panel:
@@ -803,14 +801,19 @@ class NarrationTab(ctk.CTkFrame):
         def on_voice_select(voice_data: dict) -> None:
             self._on_segment_voice_assigned(segment_id, voice_data)
         
-        browser = VoiceBrowserWidget(
+        # One browser is shared by every segment row; it is hidden, not destroyed, between uses
+        if self._segment_voice_browser is not None and self._segment_voice_browser.winfo_exists():
+            self._segment_voice_browser.show(on_select=on_voice_select)
+            return
+        
+        self._segment_voice_browser = VoiceBrowserWidget(
             self,
             voice_library=self.voice_library,
             tts_engine=self.tts_engine,
             config=self.config,
-            on_select=on_voice_select
+            on_select=on_voice_select,
+            reusable=True
         )
-        browser.wait_window()
     
     def _on_segment_voice_assigned(self, segment_id: int, voice_data: dict) -> None:
         """Handle voice assignment to a segment.
@@ -822,9 +825,8 @@ class NarrationTab(ctk.CTkFrame):
         # Store the voice data in mapping
         self.voice_mapping[segment_id] = voice_data
         
-        # Update the UI if row exists
-        if segment_id in self.segment_rows:
-            self.segment_rows[segment_id].set_voice(voice_data)
+        # Update the UI if the segment's row is on screen
+        self.segment_list_view.set_voice(segment_id, voice_data)
         
         logger.info(f"Assigned voice '{voice_data['name']}' to segment {segment_id}")
         self._update_parse_status()
@@ -932,6 +934,111 @@ class NarrationTab(ctk.CTkFrame):
                     )
                     self.generate_button.configure(state="normal")
     
+    def _preflight_models(self, segments: list) -> None:
+        """Load every model the segments' voices need, before generation starts.
+        
+        Args:
+            segments: Transcript segments whose voice fields name library voices
+        """
+        voice_types = set()
+        for voice_name in {seg.voice for seg in segments}:
+            voice_data = self.voice_library.get_voice_by_name(voice_name)
+            if voice_data:
+                voice_types.add(voice_data.get('type', 'cloned'))
+        
+        model_size = self.config.get("active_model", "1.7B")
+        if "cloned" in voice_types and self.tts_engine.base_model is None:
+            logger.info("Base model not loaded, loading now...")
+            self.tts_engine.load_base_model(model_size)
+        if "designed" in voice_types and self.tts_engine.voice_design_model is None:
+            logger.info("VoiceDesign model not loaded, loading now...")
+            self.tts_engine.load_voice_design_model(model_size)
+    
+    @staticmethod
+    def _plan_batches(segments: list, batch_size: int) -> List[list]:
+        """Group consecutive segments that share a voice and style into batches.
+        
+        Args:
+            segments: Transcript segments in order
+            batch_size: Maximum segments per batch
+            
+        Returns:
+            Batches of segments; concatenated, they are the input in order
+        """
+        batches = []
+        for _, run in groupby(segments, key=lambda seg: (seg.voice, seg.instruct)):
+            run = list(run)
+            for start in range(0, len(run), batch_size):
+                batches.append(run[start:start + batch_size])
+        return batches
+    
+    def _synthesize_batch(self, batch: list, gen_params: dict) -> Optional[Tuple[List[Any], int, str]]:
+        """Generate audio for segments that share a voice and style, in one engine call.
+        
+        The models the batch needs must already be loaded (see _preflight_models).
+        
+        Args:
+            batch: Segments from _plan_batches(); the voice field names a library voice
+            gen_params: Generation parameters passed to the TTS engine
+            
+        Returns:
+            (audio per segment, sample_rate, voice_id), or None if the voice is missing or of unknown type
+        """
+        segment = batch[0]
+        texts = [seg.text for seg in batch]
+        logger.debug(f"Generating {len(batch)} segment(s) - voice: {segment.voice}, text: '{segment.text[:50]}...'")
+        
+        voice_data = self.voice_library.get_voice_by_name(segment.voice)
+        if not voice_data:
+            logger.error(f"Voice not found: {segment.voice}")
+            return None
+        
+        voice_type = voice_data.get('type', 'cloned')
+        if voice_type == "cloned":
+            # Cloned voice - load prompt and use Base model
+            logger.debug(f"Loading cloned voice: {voice_data['id']}")
+            try:
+                # Load voice clone prompt
+                voice_prompt = self.voice_library.load_voice_clone_prompt(voice_data["id"])
+                
+                # Generate with cloned voice
+                wavs, sr = self.tts_engine.generate_voice_clone(
+                    text=texts,
+                    language=voice_data.get("language", "Auto"),
+                    voice_clone_prompt=voice_prompt,
+                    instruct=segment.instruct,
+                    **gen_params
+                )
+                logger.debug(f"Cloned voice generation successful")
+            except Exception as e:
+                logger.error(f"Failed to use cloned voice: {e}")
+                raise
+        
+        elif voice_type == "designed":
+            # Designed voice - use VoiceDesign model with description
+            logger.debug(f"Using designed voice: {voice_data['id']}")
+            try:
+                # Generate with voice design
+                # Combine per-segment style with the voice's base description
+                _base_desc = voice_data.get("description", "")
+                _seg_style = segment.instruct
+                _combined = ". ".join(p for p in [_seg_style, _base_desc] if p)
+                wavs, sr = self.tts_engine.generate_voice_design(
+                    text=texts,
+                    language=voice_data.get("language", "Auto"),
+                    instruct=_combined,
+                    **gen_params
+                )
+                logger.debug(f"Designed voice generation successful")
+            except Exception as e:
+                logger.error(f"Failed to use designed voice: {e}")
+                raise
+        else:
+            logger.error(f"Unknown voice type: {voice_type}")
+            return None
+        
+        return list(wavs), sr, voice_data["id"]
+    
     def _generate_narration(self) -> None:
         """Generate narration from segments."""
         logger.info("Starting narration generation...")
@@ -1031,7 +1138,10 @@ class NarrationTab(ctk.CTkFrame):
             logger.debug(f"Using generation params: {gen_params}")
             
             task_start = time.time()
-            seg_elapsed_times = []
+            
+            # This task runs on the worker thread; hold its stop flag directly, since
+            # Clear All may reset self.worker while generation is still running
+            stop_flag = threading.current_thread().stop_flag
             
             def _fmt_duration(secs: float) -> str:
                 """Format seconds into a human-readable duration string."""
@@ -1044,106 +1154,78 @@ class NarrationTab(ctk.CTkFrame):
                 h, m = divmod(m, 60)
                 return f"{h}h {m:02d}m"
             
-            for i, segment in enumerate(self.segments):
-                # Check for cancellation
-                if self.worker and self.worker.stop_flag.is_set():
-                    logger.info("Generation cancelled by user")
+            # Load needed models up front so no batch stalls on a model load mid-run
+            progress_callback(0, "Loading models...")
+            self._preflight_models(self.segments)
+            
+            # ETA covers synthesis only; model loading would inflate every estimate
+            synth_start = time.time()
+            
+            def synthesize(batch):
+                """Pool task: skip batches that start after a cancel."""
+                if stop_flag.is_set():
                     return None
+                return self._synthesize_batch(batch, gen_params)
+            
+            # Consecutive segments with the same voice and style share one engine call
+            batch_size = max(1, int(self.config.get("tts_batch_size", 4)))
+            batches = self._plan_batches(self.segments, batch_size)
+            logger.debug(f"Planned {len(batches)} batch(es) of up to {batch_size} segments")
+            
+            # Batches are synthesized by a small pool; results are collected in transcript order
+            workers = max(1, int(self.config.get("tts_workers", 1)))
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="narration")
+            try:
+                futures = [executor.submit(synthesize, batch) for batch in batches]
                 
-                # Compute ETA from average of completed segment durations
-                elapsed_total = time.time() - task_start
-                if seg_elapsed_times:
-                    avg_seg = sum(seg_elapsed_times) / len(seg_elapsed_times)
-                    eta_secs = avg_seg * (total - i)
-                    eta_str = f"ETA ~{_fmt_duration(eta_secs)}"
-                else:
-                    eta_str = "ETA estimating..."
-                
-                # Update progress
-                progress = int((i / total) * 100)
-                progress_callback(
-                    progress,
-                    f"Segment {i+1} / {total}  \u2022  {eta_str}  \u2022  Elapsed: {_fmt_duration(elapsed_total)}"
-                )
-                logger.debug(f"Generating segment {i+1}/{total} - voice: {segment.voice}, text: '{segment.text[:50]}...'")
-                
-                seg_start = time.time()
-                
-                text = segment.text
-                voice = segment.voice
-                voice_data = self.voice_library.get_voice_by_name(voice)
-                if voice_data:
-                    voice_type = voice_data.get('type', 'cloned')
-                    if voice_type == "cloned":
-                        # Cloned voice - load prompt and use Base model
-                        logger.debug(f"Loading cloned voice: {voice_data['id']}")
-                        try:
-                            # Ensure Base model is loaded
-                            if self.tts_engine.base_model is None:
-                                logger.info("Base model not loaded, loading now...")
-                                model_size = self.config.get("active_model", "1.7B")
-                                self.tts_engine.load_base_model(model_size)
-                            
-                            # Load voice clone prompt
-                            voice_prompt = self.voice_library.load_voice_clone_prompt(voice_data["id"])
-                            
-                            # Generate with cloned voice
-                            wavs, sr = self.tts_engine.generate_voice_clone(
-                                text=text,
-                                language=voice_data.get("language", "Auto"),
-                                voice_clone_prompt=voice_prompt,
-                                instruct=segment.instruct,
-                                **gen_params
-                            )
-                            logger.debug(f"Cloned voice generation successful")
-                            
-                            # Track usage
-                            self.voice_library.increment_usage(voice_data["id"])
-                        except Exception as e:
-                            logger.error(f"Failed to use cloned voice: {e}")
-                            raise
+                i = 0  # Segments collected so far
+                for batch, future in zip(batches, futures):
+                    # Check for cancellation
+                    if stop_flag.is_set():
+                        logger.info("Generation cancelled by user")
+                        return None
                     
-                    elif voice_type == "designed":
-                        # Designed voice - use VoiceDesign model with description
-                        logger.debug(f"Using designed voice: {voice_data['id']}")
-                        try:
-                            # Ensure VoiceDesign model is loaded
-                            if self.tts_engine.voice_design_model is None:
-                                logger.info("VoiceDesign model not loaded, loading now...")
-                                model_size = self.config.get("active_model", "1.7B")
-                                self.tts_engine.load_voice_design_model(model_size)
-                            
-                            # Generate with voice design
-                            # Combine per-segment style with the voice's base description
-                            _base_desc = voice_data.get("description", "")
-                            _seg_style = segment.instruct
-                            _combined = ". ".join(p for p in [_seg_style, _base_desc] if p)
-                            wavs, sr = self.tts_engine.generate_voice_design(
-                                text=text,
-                                language=voice_data.get("language", "Auto"),
-                                instruct=_combined,
-                                **gen_params
-                            )
-                            logger.debug(f"Designed voice generation successful")
-                            
-                            # Track usage
-                            self.voice_library.increment_usage(voice_data["id"])
-                        except Exception as e:
-                            logger.error(f"Failed to use designed voice: {e}")
-                            raise
+                    # Compute ETA from the average time per completed segment
+                    elapsed_total = time.time() - task_start
+                    if i:
+                        eta_secs = (time.time() - synth_start) / i * (total - i)
+                        eta_str = f"ETA ~{_fmt_duration(eta_secs)}"
                     else:
-                        logger.error(f"Unknown voice type: {voice_type}")
+                        eta_str = "ETA estimating..."
+                    
+                    # Update progress
+                    progress = int((i / total) * 100)
+                    progress_callback(
+                        progress,
+                        f"Segment {i+1} / {total}  \u2022  {eta_str}  \u2022  Elapsed: {_fmt_duration(elapsed_total)}"
+                    )
+                    
+                    result = future.result()
+                    i += len(batch)
+                    if result is None:
                         continue
-                else:
-                    logger.error(f"Voice not found: {voice}")
-                    continue
-                
-                seg_elapsed_times.append(time.time() - seg_start)
-                logger.debug(f"Segment {i+1} generated successfully ({seg_elapsed_times[-1]:.1f}s)")
-                segments_audio.append((wavs[0], sr))
+                    
+                    wavs, sr, voice_id = result
+                    if len(wavs) != len(batch):
+                        raise RuntimeError(f"Expected {len(batch)} audio clips from the engine, got {len(wavs)}")
+                    
+                    # Track usage here, not in the pool, so library saves never overlap
+                    for _ in batch:
+                        self.voice_library.increment_usage(voice_id)
+                    
+                    logger.debug(f"Segments up to {i} generated successfully")
+                    segments_audio.extend((wav, sr) for wav in wavs)
+            finally:
+                # Drop queued batches on cancel or error, and wait for the in-flight ones
+                # so a new run can never overlap a generate() call still using the model
+                executor.shutdown(wait=True, cancel_futures=True)
             
             total_elapsed = time.time() - task_start
-            logger.info(f"All {total} segments generated successfully in {_fmt_duration(total_elapsed)}")
+            synth_elapsed = time.time() - synth_start
+            logger.info(
+                f"All {total} segments generated successfully in {_fmt_duration(synth_elapsed)} "
+                f"({_fmt_duration(total_elapsed)} including model loading)"
+            )
             return segments_audio
         
         def on_progress(percentage, message):
@@ -1372,7 +1454,7 @@ class NarrationTab(ctk.CTkFrame):
             self.speaker_assignment_panel = None
 
         # Clear segments frame widgets and rows
-        self.segment_rows = {}
+        self.segment_list_view.clear()
         for w in self.segments_frame.winfo_children():
             w.destroy()
 
@@ -1704,10 +1786,12 @@ class NarrationTab(ctk.CTkFrame):
             # Apply speaker assignments (annotated mode)
             elif mode == "annotated":
                 if self.speaker_assignment_panel:
+                    restored = {}
                     for speaker, voice_name in session.get("speaker_assignments", {}).items():
                         vd = self.voice_library.get_voice_by_name(voice_name)
                         if vd:
-                            self.speaker_assignment_panel.set_assignment(speaker, vd)
+                            restored[speaker] = vd
+                    self.speaker_assignment_panel.set_assignments(restored)
 
             # Restore per-segment instruct overrides
             for seg_idx_str, instruct_val in session.get("segment_instructs", {}).items():
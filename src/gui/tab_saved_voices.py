@@ -9,7 +9,7 @@ from datetime import datetime
 
 from core.audio_utils import AudioPlayer
 from utils.error_handler import logger
-from utils.theme import get_theme_colors
+from utils.theme import get_theme_colors, get_font
 
 if TYPE_CHECKING:
     from utils.workspace_manager import WorkspaceManager
@@ -37,6 +37,8 @@ class SavedVoicesTab(ctk.CTkFrame):
         self.selected_voice: Optional[dict] = None
         self.selected_row_frame: Optional[List[ctk.CTkFrame]] = None  # Track selected row cells for highlighting
         self.row_original_colors: dict = {}  # Map of cell frames to their original colors
+        self._row_pool: List[dict] = []  # Reusable table rows, see _create_voice_row
+        self._no_voices_label: Optional[ctk.CTkLabel] = None
         self.filter_type = "all"  # all, cloned, designed
         self.search_query = ""
         self.search_tags: List[str] = []
@@ -237,17 +239,14 @@ class SavedVoicesTab(ctk.CTkFrame):
         self._refresh_voice_list()
     
     def _refresh_voice_list(self) -> None:
-        """Refresh the voice list display."""
-        # Clear existing voice items
-        for widget in self.voice_list_frame.winfo_children():
-            widget.destroy()
-        
-        # Clear selected row reference and color mapping
-        self.selected_row_frame = None
-        self.row_original_colors.clear()
+        """Refresh the voice list display.
         
-        # Recreate table header
-        self._create_table_header()
+        Table rows are pooled: existing rows are rebound to the new voices and
+        surplus rows are hidden, so searching and filtering only create widgets
+        when the list grows beyond anything shown before.
+        """
+        # Clear selected row highlight
+        self._unhighlight_selected_row()
         
         # Get filtered voices
         voice_type = None if self.filter_type == "all" else self.filter_type
@@ -267,132 +266,149 @@ class SavedVoicesTab(ctk.CTkFrame):
         # Update count
         self.count_label.configure(text=f"{len(voices)} voice{'s' if len(voices) != 1 else ''}")
         
-        # Create voice items as table rows
+        # Rebind pooled rows, creating new ones only when needed
         for idx, voice in enumerate(voices):
-            self._create_voice_row(voice, idx + 1)
+            if idx == len(self._row_pool):
+                self._row_pool.append(self._create_voice_row(idx + 1))
+            self._bind_voice_row(self._row_pool[idx], voice)
+        
+        # Hide surplus rows
+        for row in self._row_pool[len(voices):]:
+            if row["visible"]:
+                for cell in row["cells"]:
+                    cell.grid_remove()
+                row["visible"] = False
+            row["voice"] = None
         
         # Show message if no voices
         if not voices:
-            colors = get_theme_colors()
-            no_voices_label = ctk.CTkLabel(
-                self.voice_list_frame,
-                text="No voices found" if self.search_query or self.search_tags else "No saved voices yet",
-                text_color=colors["text_secondary"]
-            )
-            no_voices_label.grid(row=1, column=0, columnspan=5, pady=20)
+            text = "No voices found" if self.search_query or self.search_tags else "No saved voices yet"
+            if self._no_voices_label is None:
+                colors = get_theme_colors()
+                self._no_voices_label = ctk.CTkLabel(
+                    self.voice_list_frame,
+                    text=text,
+                    text_color=colors["text_secondary"]
+                )
+                self._no_voices_label.grid(row=1, column=0, columnspan=5, pady=20)
+            else:
+                self._no_voices_label.configure(text=text)
+                self._no_voices_label.grid()
+        elif self._no_voices_label is not None:
+            self._no_voices_label.grid_remove()
     
-    def _create_voice_row(self, voice: dict, row_num: int) -> None:
-        """Create a voice table row.
+    def _create_voice_row(self, row_num: int) -> dict:
+        """Create an empty voice table row.
         
         Args:
-            voice: Voice data dictionary
             row_num: Row number in the table
+            
+        Returns:
+            Row record with its cells, labels and bound voice
         """
         colors = get_theme_colors()
         row_bg = colors["row_even"] if row_num % 2 == 0 else colors["row_odd"]
         
-        # Create list to track all cell frames in this row for click handling
-        row_cells = []
-        
-        # Name column
-        name_frame = ctk.CTkFrame(self.voice_list_frame, fg_color=row_bg, cursor="hand2")
-        name_frame.grid(row=row_num, column=0, sticky="ew", padx=(2, 1), pady=1)
-        name_label = ctk.CTkLabel(
-            name_frame,
-            text=voice["name"],
-            font=("Arial", 11),
-            text_color=colors["text_primary"],
-            anchor="w"
-        )
-        name_label.pack(fill="both", expand=True, padx=8, pady=6)
-        row_cells.append(name_frame)
+        # Columns: name, type, created, usage, tags
+        column_fonts = [get_font(11), get_font(10), get_font(10), get_font(10), get_font(10)]
+        column_padx = [(2, 1), 1, 1, 1, (1, 2)]
         
-        # Type column
-        type_color = colors["type_cloned"] if voice["type"] == "cloned" else colors["type_designed"]
-        type_frame = ctk.CTkFrame(self.voice_list_frame, fg_color=row_bg, cursor="hand2")
-        type_frame.grid(row=row_num, column=1, sticky="ew", padx=1, pady=1)
-        type_label = ctk.CTkLabel(
-            type_frame,
-            text=voice["type"].capitalize(),
-            font=("Arial", 10),
-            text_color=type_color,
-            anchor="w"
-        )
-        type_label.pack(fill="both", expand=True, padx=8, pady=6)
-        row_cells.append(type_frame)
-        
-        # Created column
-        created_date = self._format_date_short(voice.get("created", ""))
-        created_frame = ctk.CTkFrame(self.voice_list_frame, fg_color=row_bg, cursor="hand2")
-        created_frame.grid(row=row_num, column=2, sticky="ew", padx=1, pady=1)
-        created_label = ctk.CTkLabel(
-            created_frame,
-            text=created_date,
-            font=("Arial", 10),
-            text_color=colors["text_secondary"],
-            anchor="w"
-        )
-        created_label.pack(fill="both", expand=True, padx=8, pady=6)
-        row_cells.append(created_frame)
-        
-        # Usage column
-        usage_count = voice.get("usage_count", 0)
-        usage_frame = ctk.CTkFrame(self.voice_list_frame, fg_color=row_bg, cursor="hand2")
-        usage_frame.grid(row=row_num, column=3, sticky="ew", padx=1, pady=1)
-        usage_label = ctk.CTkLabel(
-            usage_frame,
-            text=str(usage_count),
-            font=("Arial", 10),
-            text_color=colors["text_secondary"],
-            anchor="w"
-        )
-        usage_label.pack(fill="both", expand=True, padx=8, pady=6)
-        row_cells.append(usage_frame)
-        
-        # Tags column
-        tags_text = ", ".join(voice.get("tags", [])[:3])  # Show first 3 tags
-        if len(voice.get("tags", [])) > 3:
-            tags_text += "..."
-        tags_frame = ctk.CTkFrame(self.voice_list_frame, fg_color=row_bg, cursor="hand2")
-        tags_frame.grid(row=row_num, column=4, sticky="ew", padx=(1, 2), pady=1)
-        tags_label = ctk.CTkLabel(
-            tags_frame,
-            text=tags_text if tags_text else "-",
-            font=("Arial", 10),
-            text_color=colors["text_secondary"],
-            anchor="w"
-        )
-        tags_label.pack(fill="both", expand=True, padx=8, pady=6)
-        row_cells.append(tags_frame)
+        row = {"cells": [], "labels": [], "voice": None, "key": None, "visible": True}
         
-        # Store original color and cell references for restoration
-        for cell in row_cells:
+        for col, (font, padx) in enumerate(zip(column_fonts, column_padx)):
+            cell = ctk.CTkFrame(self.voice_list_frame, fg_color=row_bg, cursor="hand2")
+            cell.grid(row=row_num, column=col, sticky="ew", padx=padx, pady=1)
+            label = ctk.CTkLabel(
+                cell,
+                text="",
+                font=font,
+                text_color=colors["text_secondary"],
+                anchor="w"
+            )
+            label.pack(fill="both", expand=True, padx=8, pady=6)
+            row["cells"].append(cell)
+            row["labels"].append(label)
+            
+            # Store original color for restoration after selection
             self.row_original_colors[cell] = row_bg
         
-        # Click handler
-        def select_voice(e=None):
-            # Unhighlight previous selection
-            if self.selected_row_frame is not None:
-                for cell in self.selected_row_frame:
-                    if cell in self.row_original_colors:
-                        cell.configure(fg_color=self.row_original_colors[cell])
-            
-            # Highlight this row
-            for cell in row_cells:
-                cell.configure(fg_color=colors["row_selected"])
-            
-            # Store reference to this row's cells
-            self.selected_row_frame = row_cells
-            
-            # Show voice details
-            self._select_voice(voice)
+        row["labels"][0].configure(text_color=colors["text_primary"])
         
         # Bind click events to all cells and labels
-        for cell in row_cells:
+        select_voice = lambda e=None: self._on_voice_row_clicked(row)
+        for cell, label in zip(row["cells"], row["labels"]):
             cell.bind("<Button-1>", select_voice)
-            # Also bind to the label inside
-            for widget in cell.winfo_children():
-                widget.bind("<Button-1>", select_voice)
+            label.bind("<Button-1>", select_voice)
+        
+        return row
+    
+    def _bind_voice_row(self, row: dict, voice: dict) -> None:
+        """Show a voice in a pooled table row.
+        
+        Args:
+            row: Row record from _create_voice_row
+            voice: Voice data dictionary
+        """
+        row["voice"] = voice
+        
+        tags = voice.get("tags", [])
+        key = (
+            voice["id"], voice["name"], voice["type"],
+            voice.get("created", ""), voice.get("usage_count", 0), tuple(tags)
+        )
+        
+        # Only touch widgets when the displayed data changed
+        if key != row["key"]:
+            row["key"] = key
+            colors = get_theme_colors()
+            name_label, type_label, created_label, usage_label, tags_label = row["labels"]
+            
+            type_color = colors["type_cloned"] if voice["type"] == "cloned" else colors["type_designed"]
+            tags_text = ", ".join(tags[:3])  # Show first 3 tags
+            if len(tags) > 3:
+                tags_text += "..."
+            
+            name_label.configure(text=voice["name"])
+            type_label.configure(text=voice["type"].capitalize(), text_color=type_color)
+            created_label.configure(text=self._format_date_short(voice.get("created", "")))
+            usage_label.configure(text=str(voice.get("usage_count", 0)))
+            tags_label.configure(text=tags_text if tags_text else "-")
+        
+        if not row["visible"]:
+            for cell in row["cells"]:
+                cell.grid()
+            row["visible"] = True
+    
+    def _unhighlight_selected_row(self) -> None:
+        """Restore the original colors of the selected row, if any."""
+        if self.selected_row_frame is not None:
+            for cell in self.selected_row_frame:
+                if cell in self.row_original_colors:
+                    cell.configure(fg_color=self.row_original_colors[cell])
+            self.selected_row_frame = None
+    
+    def _on_voice_row_clicked(self, row: dict) -> None:
+        """Highlight a table row and show its voice details.
+        
+        Args:
+            row: Row record from _create_voice_row
+        """
+        if row["voice"] is None:
+            return
+        
+        # Unhighlight previous selection
+        self._unhighlight_selected_row()
+        
+        # Highlight this row
+        colors = get_theme_colors()
+        for cell in row["cells"]:
+            cell.configure(fg_color=colors["row_selected"])
+        
+        # Store reference to this row's cells
+        self.selected_row_frame = row["cells"]
+        
+        # Show voice details
+        self._select_voice(row["voice"])
     
     def _format_date_short(self, iso_date: str) -> str:
         """Format ISO date string to short format.
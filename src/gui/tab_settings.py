@@ -1033,7 +1033,7 @@ class SettingsTab(ctk.CTkFrame):
         old_active_model = self.config.get("active_model", None)
         old_device = self.config.get("device", "cuda:0")
         
-        model_selection = show_model_selection_dialog()
+        model_selection = show_model_selection_dialog(self.winfo_toplevel())
         
         # User cancelled dialog
         if not model_selection:
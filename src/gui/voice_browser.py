@@ -215,7 +215,8 @@ class VoiceBrowserWidget(ctk.CTkToplevel):
         config,
         on_select: Callable[[dict], None],
         current_selection: Optional[str] = None,
-        title: str = "Select Voice"
+        title: str = "Select Voice",
+        reusable: bool = False
     ):
         """Initialize voice browser.
         
@@ -227,9 +228,11 @@ class VoiceBrowserWidget(ctk.CTkToplevel):
             on_select: Callback when voice is selected (receives voice data dictionary)
             current_selection: Currently selected voice name
             title: Window title
+            reusable: Withdraw instead of destroying on close so show() can reopen it
         """
         super().__init__(parent)
         
+        self._reusable = reusable
         self.voice_library = voice_library
         self.tts_engine = tts_engine
         self.config = config
@@ -579,10 +582,44 @@ class VoiceBrowserWidget(ctk.CTkToplevel):
         except Exception:
             pass
 
+    def show(self, on_select: Callable[[dict], None], current_selection: Optional[str] = None) -> None:
+        """Reopen a reusable browser for a new selection.
+        
+        Args:
+            on_select: Callback when voice is selected (receives voice data dictionary)
+            current_selection: Currently selected voice name
+        """
+        self.on_select_callback = on_select
+        self.current_selection = current_selection
+        self.selected_voice = current_selection
+        self.selected_voice_data = None
+        
+        self.selection_label.configure(text=f"Selected: {current_selection or 'None'}")
+        self.confirm_btn.configure(state="normal" if current_selection else "disabled")
+        
+        # Library may have changed since the last open
+        self._populate_voices()
+        
+        if VoiceBrowserWidget._last_position is not None:
+            x, y = VoiceBrowserWidget._last_position
+            self.geometry(f"+{x}+{y}")
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+    
+    def _dismiss(self) -> None:
+        """Hide (reusable) or destroy the browser."""
+        self._save_position()
+        if self._reusable:
+            self.audio_player.stop()
+            self.grab_release()
+            self.withdraw()
+        else:
+            self.destroy()
+    
     def _on_close(self) -> None:
         """Handle window close via title-bar X."""
-        self._save_position()
-        self.destroy()
+        self._dismiss()
 
     def _on_confirm(self) -> None:
         """Confirm selection and close."""
@@ -594,10 +631,8 @@ class VoiceBrowserWidget(ctk.CTkToplevel):
                 pass
             if self.on_select_callback:
                 self.on_select_callback(self.selected_voice_data)
-        self._save_position()
-        self.destroy()
+        self._dismiss()
     
     def _on_cancel(self) -> None:
         """Cancel selection and close."""
-        self._save_position()
-        self.destroy()
+        self._dismiss()
@@ -4,13 +4,16 @@ import json
 import os
 import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, Iterable, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from utils.workspace_manager import WorkspaceManager
 
 from utils.voice_description_generator import generate_random_voice_descriptions
 
+# Sentinel for cached lookups of keys that are not present
+_MISSING = object()
+
 
 class Config:
     """Application configuration manager."""
@@ -25,6 +28,8 @@ class Config:
         self.config_path = workspace_mgr.get_config_file()
         self.config: Dict[str, Any] = {}
         self._lock = threading.RLock()
+        self._cache: Dict[str, Any] = {}  # Memoized get() lookups, cleared on any change
+        self._dirty: Set[str] = set()  # Keys changed since the last successful save
         
         # Configuration defaults
         self.defaults = {
@@ -37,6 +42,8 @@ class Config:
             "window_height": 800,
             "font_size": 100,
             "use_flash_attention": True,
+            "tts_workers": 1,  # Narration batches synthesized concurrently
+            "tts_batch_size": 4,  # Max consecutive same-voice segments per engine call
             "downloaded_models": [],  # List of downloaded models: ["1.7B", "0.6B"]
             "active_model": None,  # Currently active model: "1.7B" or "0.6B"
             "generation_params": {
@@ -59,6 +66,7 @@ class Config:
     def load(self) -> None:
         """Load configuration from file."""
         with self._lock:
+            self._cache.clear()
             try:
                 if self.config_path.exists():
                     with open(self.config_path, 'r', encoding='utf-8') as f:
@@ -67,11 +75,13 @@ class Config:
                     self._merge_defaults()
                 else:
                     self.config = self.defaults.copy()
+                    self._dirty.update(self.config)
                     self.save()
                 
                 # Generate example voice descriptions if empty
                 if not self.config.get("example_voice_descriptions"):
                     self.config["example_voice_descriptions"] = generate_random_voice_descriptions(25)
+                    self._dirty.add("example_voice_descriptions")
                     self.save()
                     
             except Exception as e:
@@ -84,12 +94,14 @@ class Config:
         for key, value in self.defaults.items():
             if key not in self.config:
                 self.config[key] = value
+                self._dirty.add(key)
                 updated = True
             elif isinstance(value, dict) and isinstance(self.config[key], dict):
                 # Merge nested dictionaries
                 for subkey, subvalue in value.items():
                     if subkey not in self.config[key]:
                         self.config[key][subkey] = subvalue
+                        self._dirty.add(f"{key}.{subkey}")
                         updated = True
         
         # Save config if new defaults were added
@@ -97,13 +109,19 @@ class Config:
             self.save()
     
     def save(self) -> None:
-        """Save configuration to file."""
+        """Save configuration to file.
+        
+        Does nothing if no value has changed since the last save.
+        """
         with self._lock:
+            if not self._dirty:
+                return
             try:
                 # Ensure directory exists
                 self.config_path.parent.mkdir(parents=True, exist_ok=True)
                 with open(self.config_path, 'w', encoding='utf-8') as f:
                     json.dump(self.config, f, indent=2)
+                self._dirty.clear()
             except Exception as e:
                 print(f"Error saving config: {e}")
     
@@ -117,13 +135,42 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split('.')
+        with self._lock:
+            if key in self._cache:
+                value = self._cache[key]
+            else:
+                value = self._lookup(key)
+                self._cache[key] = value
+        return default if value is _MISSING else value
+    
+    def get_many(self, keys: Iterable[str], default: Any = None) -> Tuple[Any, ...]:
+        """Get several configuration values in one call.
+        
+        Args:
+            keys: Configuration keys (dot notation supported)
+            default: Default value for any key not found
+            
+        Returns:
+            Tuple of values in the same order as keys
+        """
+        with self._lock:
+            return tuple(self.get(key, default) for key in keys)
+    
+    def _lookup(self, key: str) -> Any:
+        """Resolve a (possibly dotted) key against the loaded configuration.
+        
+        Args:
+            key: Configuration key
+            
+        Returns:
+            Configuration value or _MISSING if not found
+        """
         value = self.config
-        for k in keys:
+        for k in key.split('.'):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
         return value
     
     def set(self, key: str, value: Any, save: bool = True) -> None:
@@ -134,20 +181,30 @@ class Config:
             value: Value to set
             save: Whether to save configuration immediately
         """
-        keys = key.split('.')
-        config = self.config
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
-        config[keys[-1]] = value
+        with self._lock:
+            keys = key.split('.')
+            config = self.config
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+            
+            # Setting an equal value is a no-op (same object may have been mutated in place)
+            current = config.get(keys[-1], _MISSING)
+            if current is value or current != value:
+                config[keys[-1]] = value
+                self._cache.clear()
+                self._dirty.add(key)
         
         if save:
             self.save()
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values."""
-        self.config = self.defaults.copy()
+        with self._lock:
+            self.config = self.defaults.copy()
+            self._cache.clear()
+            self._dirty.update(self.config)
         self.save()
     
     def regenerate_voice_descriptions(self, count: int = 25) -> None:
@@ -156,5 +213,8 @@ class Config:
         Args:
             count: Number of descriptions to generate (default: 25)
         """
-        self.config["example_voice_descriptions"] = generate_random_voice_descriptions(count)
+        with self._lock:
+            self.config["example_voice_descriptions"] = generate_random_voice_descriptions(count)
+            self._cache.clear()
+            self._dirty.add("example_voice_descriptions")
         self.save()
@@ -1,12 +1,49 @@
 """Centralized theme and color management for the application."""
 
+from functools import lru_cache
+from typing import Dict, Tuple, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import customtkinter as ctk
+
+# Shared CTkFont instances keyed by (family, size, weight)
+_FONT_CACHE: Dict[Tuple[str, int, str], "ctk.CTkFont"] = {}
+
+
+def get_font(size: int, weight: str = "normal", family: str = "Arial") -> "ctk.CTkFont":
+    """Get a shared font object, creating it on first use.
+    
+    Passing a font tuple makes CustomTkinter build a new font for every
+    widget; sharing one CTkFont per style avoids that. A Tk root must exist
+    before the first call.
+    
+    Args:
+        size: Font size in points
+        weight: "normal" or "bold"
+        family: Font family name
+        
+    Returns:
+        Cached CTkFont instance
+    """
+    key = (family, size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        import customtkinter as ctk
+        font = ctk.CTkFont(family=family, size=size, weight=weight)
+        _FONT_CACHE[key] = font
+    return font
+
+
+@lru_cache(maxsize=1)
 def get_theme_colors() -> dict:
     """Get theme-appropriate colors based on appearance mode.
     
     CustomTkinter automatically handles appearance mode switching.
     Colors are specified as tuples: (light_mode_color, dark_mode_color)
     
+    The palette doesn't depend on the current mode, so it is built once and
+    the same dictionary is returned to every caller; treat it as read-only.
+    
     Returns:
         Dictionary of color names to theme-aware color tuples
     """
@@ -17,6 +54,7 @@ def get_theme_colors() -> dict:
         "row_odd": ("white", "gray14"),
         "row_selected": ("gray80", "gray25"),
         "panel_bg": ("gray90", "gray18"),
+        "overlay_bg": ("gray75", "gray10"),        # Backdrop behind in-window overlays
         
         # Text colors - PRIMARY/SECONDARY avoid hard-coded white/gray
         "text_primary": ("gray10", "gray90"),      # Main text (dark in light, light in dark)
@@ -0,0 +1,69 @@
+"""Tests for GUI component teardown."""
+
+import sys
+import tkinter as tk
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+src_path = Path(__file__).parent / "src"
+sys.path.insert(0, str(src_path))
+
+ctk = pytest.importorskip("customtkinter")
+
+
+@pytest.fixture
+def root():
+    """Create a hidden Tk root that records errors raised in Tk callbacks."""
+    try:
+        app = ctk.CTk()
+    except tk.TclError as e:
+        pytest.skip(f"No display available: {e}")
+    app.withdraw()
+
+    app.callback_errors = []
+    app.report_callback_exception = lambda *exc_info: app.callback_errors.append(exc_info)
+    yield app
+    app.destroy()
+
+
+def test_audio_player_widget_destroyed_with_completion_pending(root):
+    """A clip finishing just before the widget is destroyed must not touch the widget."""
+    pytest.importorskip("numpy")
+    pytest.importorskip("sounddevice")
+    from gui.components import AudioPlayerWidget
+
+    widget = AudioPlayerWidget(root)
+    widget._showing_playback = True
+
+    # What the audio thread does when a clip ends
+    widget._schedule_complete()
+    assert widget._complete_after_id is not None
+
+    widget.destroy()
+    assert widget._destroyed
+    assert widget._complete_after_id is None
+
+    root.update()
+    assert root.callback_errors == []
+
+    # A completion reported after destruction is dropped
+    widget._schedule_complete()
+    root.update()
+    assert root.callback_errors == []
+
+
+def test_speaker_panel_destroyed_with_validation_pending(root):
+    """Destroying the panel cancels its queued validation refresh."""
+    from gui.speaker_assignment import SpeakerAssignmentPanel
+
+    panel = SpeakerAssignmentPanel(root, None, None, None, speakers=["Alice", "Bob"])
+    panel.set_assignment("Alice", {"name": "Voice A", "type": "designed"})
+    assert panel._validation_after_id is not None
+
+    panel.destroy()
+    assert panel._validation_after_id is None
+
+    root.update()
+    assert root.callback_errors == []